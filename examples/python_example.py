@@ -1,184 +1,243 @@
 """Python example for using Arrow Zerobus SDK Wrapper
 
 This example demonstrates how to use the wrapper from Python to send
-Arrow RecordBatch data to Zerobus.
+Arrow RecordBatch data to Zerobus. It requires numpy in addition to pyarrow.
 """
 
 import asyncio
+import logging
 import os
+from contextlib import contextmanager
+from itertools import islice
+from types import SimpleNamespace
+import numpy as np
 import pyarrow as pa
-from arrow_zerobus_sdk_wrapper import ZerobusWrapper, ZerobusError
+from arrow_zerobus_sdk_wrapper import (
+    WrapperConfiguration,
+    ZerobusError,
+    ZerobusWrapper,
+)
+
+# Progress is logged at INFO; set LOGLEVEL=INFO to see it
+logger = logging.getLogger(__name__)
+
+# Configuration is read from environment variables once at import time
+CFG = SimpleNamespace(
+    endpoint=os.environ.get(
+        "ZEROBUS_ENDPOINT", "https://your-workspace.cloud.databricks.com"
+    ),
+    table_name=os.environ.get("ZEROBUS_TABLE_NAME", "my_table"),
+    client_id=os.environ.get("ZEROBUS_CLIENT_ID", "your_client_id"),
+    client_secret=os.environ.get("ZEROBUS_CLIENT_SECRET", "your_client_secret"),
+    unity_catalog_url=os.environ.get("UNITY_CATALOG_URL", "https://unity-catalog-url"),
+)
+
+
+def make_config():
+    """Build the wrapper configuration from the environment settings."""
+    return WrapperConfiguration(
+        endpoint=CFG.endpoint,
+        table_name=CFG.table_name,
+        client_id=CFG.client_id,
+        client_secret=CFG.client_secret,
+        unity_catalog_url=CFG.unity_catalog_url,
+        debug_enabled=False,  # Set to True to enable debug file output
+    )
+
+
+@contextmanager
+def open_wrapper():
+    """Create a wrapper and shut it down when the block exits."""
+    wrapper = ZerobusWrapper(make_config())
+    try:
+        yield wrapper
+    finally:
+        wrapper.shutdown()
+
+
+# Schema and column data are built once at import time and reused by every run,
+# rather than re-converting Python lists into Arrow arrays on each call.
+_SCHEMA = pa.schema(
+    [
+        pa.field("id", pa.int64()),
+        pa.field("name", pa.string()),
+        pa.field("score", pa.float64()),
+    ]
+)
+# Numeric columns wrap NumPy buffers directly instead of boxing each Python value
+_IDS = pa.array(np.arange(1, 6, dtype=np.int64))
+_NAMES = pa.array(["Alice", "Bob", "Charlie", "David", "Eve"], type=pa.string())
+_SCORES = pa.array(np.asarray([95.5, 87.0, 92.5, 88.0, 91.0], dtype=np.float64))
+_ID_NAME_SCHEMA = _SCHEMA.remove(2)
 
 
 async def main():
     """Main example function."""
-    # Get configuration from environment variables
-    endpoint = os.getenv(
-        "ZEROBUS_ENDPOINT", "https://your-workspace.cloud.databricks.com"
-    )
-    table_name = os.getenv("ZEROBUS_TABLE_NAME", "my_table")
-    client_id = os.getenv("ZEROBUS_CLIENT_ID", "your_client_id")
-    client_secret = os.getenv("ZEROBUS_CLIENT_SECRET", "your_client_secret")
-    unity_catalog_url = os.getenv("UNITY_CATALOG_URL", "https://unity-catalog-url")
-
     # Initialize wrapper
-    print("Initializing ZerobusWrapper...")
+    logger.info("Initializing ZerobusWrapper...")
     try:
-        wrapper = ZerobusWrapper(
-            endpoint=endpoint,
-            table_name=table_name,
-            client_id=client_id,
-            client_secret=client_secret,
-            unity_catalog_url=unity_catalog_url,
-            debug_enabled=False,  # Set to True to enable debug file output
-        )
-        print("✅ Wrapper initialized successfully")
+        wrapper = ZerobusWrapper(make_config())
+        logger.info("Wrapper initialized successfully")
     except ZerobusError as e:
-        print(f"❌ Failed to initialize wrapper: {e}")
+        logger.error("❌ Failed to initialize wrapper: %s", e)
         return
 
     # Create Arrow RecordBatch
-    print("\nCreating Arrow RecordBatch...")
-    schema = pa.schema(
-        [
-            pa.field("id", pa.int64()),
-            pa.field("name", pa.string()),
-            pa.field("score", pa.float64()),
-        ]
-    )
-
-    arrays = [
-        pa.array([1, 2, 3, 4, 5], type=pa.int64()),
-        pa.array(["Alice", "Bob", "Charlie", "David", "Eve"], type=pa.string()),
-        pa.array([95.5, 87.0, 92.5, 88.0, 91.0], type=pa.float64()),
-    ]
-
-    batch = pa.RecordBatch.from_arrays(arrays, schema=schema)
-    print(
-        f"✅ Created RecordBatch with {batch.num_rows} rows and {batch.num_columns} columns"
+    batch = pa.RecordBatch.from_arrays([_IDS, _NAMES, _SCORES], schema=_SCHEMA)
+    logger.info(
+        "Created RecordBatch with %d rows and %d columns",
+        batch.num_rows,
+        batch.num_columns,
     )
 
     # Send batch to Zerobus
-    print("\nSending batch to Zerobus...")
+    logger.info("Sending batch to Zerobus...")
     original_batch = batch  # Keep reference for quarantine workflow
     try:
         result = wrapper.send_batch(batch)
 
         if result.success:
-            print("✅ Batch sent successfully!")
-            print(f"   Latency: {result.latency_ms}ms")
-            print(f"   Size: {result.batch_size_bytes} bytes")
-            print(f"   Attempts: {result.attempts}")
-            
+            logger.info(
+                "Batch sent successfully (latency: %sms, size: %d bytes, attempts: %d)",
+                result.latency_ms,
+                result.batch_size_bytes,
+                result.attempts,
+            )
+
+            # Compute the row-level analysis once instead of querying the
+            # result method by method
+            info = result.analyze()
+
             # Handle per-row errors with quarantine workflow
-            if result.is_partial_success():
-                print("\n⚠️  Partial success detected:")
-                print(f"   Total rows: {result.total_rows}")
-                print(f"   Successful: {result.successful_count}")
-                print(f"   Failed: {result.failed_count}")
-                
+            if info.partial:
+                logger.warning(
+                    "⚠️  Partial success: %d of %d rows succeeded, %d failed",
+                    result.successful_count,
+                    result.total_rows,
+                    result.failed_count,
+                )
+
                 # Extract and write successful rows to main table
                 successful_batch = result.extract_successful_batch(original_batch)
                 if successful_batch is not None:
-                    print(f"\n✅ Writing {successful_batch.num_rows} successful rows to main table...")
+                    logger.info(
+                        "Writing %d successful rows to main table...",
+                        successful_batch.num_rows,
+                    )
                     # In a real application, you would write successful_batch to your main table here
                     # await write_to_main_table(successful_batch)
-                
+
                 # Extract and quarantine failed rows
                 failed_batch = result.extract_failed_batch(original_batch)
                 if failed_batch is not None:
-                    print(f"\n❌ Quarantining {failed_batch.num_rows} failed rows...")
-                    failed_indices = result.get_failed_row_indices()
-                    if result.failed_rows:
-                        for row_idx, error_msg in result.failed_rows:
-                            print(f"   Row {row_idx}: {error_msg}")
+                    logger.warning(
+                        "❌ Quarantining %d failed rows...", failed_batch.num_rows
+                    )
+                    for row_idx, error_msg in zip(info.failed_indices, info.messages):
+                        logger.warning("   Row %d: %s", row_idx, error_msg)
                     # In a real application, you would quarantine failed_batch here
                     # await quarantine_batch(failed_batch)
-            elif result.has_failed_rows():
-                print("\n❌ All rows failed")
+            elif info.failed_indices:
+                logger.error("❌ All rows failed")
                 failed_batch = result.extract_failed_batch(original_batch)
                 if failed_batch is not None:
-                    print(f"   Quarantining {failed_batch.num_rows} failed rows...")
+                    logger.error(
+                        "   Quarantining %d failed rows...", failed_batch.num_rows
+                    )
                     # In a real application, you would quarantine failed_batch here
                     # await quarantine_batch(failed_batch)
             else:
-                print(f"\n✅ All {result.successful_count} rows succeeded!")
-            
-            # Error analysis and pattern detection
-            if result.has_failed_rows():
-                print("\n📊 Error Analysis:")
-                stats = result.get_error_statistics()
-                print(f"   Success rate: {stats['success_rate'] * 100:.1}%")
-                print(f"   Failure rate: {stats['failure_rate'] * 100:.1}%")
-                
-                grouped = result.group_errors_by_type()
+                logger.info("All %d rows succeeded", result.successful_count)
+
+            # Error analysis and pattern detection, only formatted when it is logged
+            if info.failed_indices and logger.isEnabledFor(logging.INFO):
+                stats = info.statistics
+                grouped = info.grouped_errors
+                error_messages = info.messages
+
+                # Build the whole block first so it is written out in one go
+                report = [
+                    "Error Analysis:",
+                    f"   Success rate: {stats['success_rate'] * 100:.1f}%",
+                    f"   Failure rate: {stats['failure_rate'] * 100:.1f}%",
+                ]
                 if grouped:
-                    print("   Error breakdown by type:")
-                    for error_type, indices in grouped.items():
-                        print(f"     {error_type}: {len(indices)} rows (indices: {indices})")
-                
-                # Get all error messages for debugging
-                error_messages = result.get_error_messages()
+                    report.append("   Error breakdown by type:")
+                    report.extend(
+                        f"     {error_type}: {len(indices)} rows (indices: {indices})"
+                        for error_type, indices in grouped.items()
+                    )
+
+                # Sample error messages for debugging
                 if error_messages:
-                    print("   Sample error messages:")
-                    for i, msg in enumerate(error_messages[:3]):
-                        print(f"     {i + 1}. {msg}")
+                    report.append("   Sample error messages:")
+                    report.extend(
+                        f"     {i + 1}. {msg}"
+                        for i, msg in enumerate(islice(error_messages, 3))
+                    )
                     if len(error_messages) > 3:
-                        print(f"     ... and {len(error_messages) - 3} more")
+                        report.append(f"     ... and {len(error_messages) - 3} more")
+                logger.info("\n".join(report))
         else:
-            print("❌ Transmission failed")
-            print(f"   Error: {result.error}")
-            print(f"   Attempts: {result.attempts}")
+            logger.error(
+                "❌ Transmission failed after %d attempts: %s",
+                result.attempts,
+                result.error,
+            )
     except ZerobusError as e:
-        print(f"❌ Transmission error: {e}")
+        logger.error("❌ Transmission error: %s", e)
 
     # Shutdown wrapper
-    print("\nShutting down wrapper...")
+    logger.info("Shutting down wrapper...")
     try:
         wrapper.shutdown()
-        print("✅ Wrapper shut down successfully")
+        logger.info("Wrapper shut down successfully")
     except ZerobusError as e:
-        print(f"❌ Shutdown error: {e}")
+        logger.error("❌ Shutdown error: %s", e)
 
 
 async def main_with_context_manager():
-    """Example using async context manager."""
-    endpoint = os.getenv(
-        "ZEROBUS_ENDPOINT", "https://your-workspace.cloud.databricks.com"
-    )
-    table_name = os.getenv("ZEROBUS_TABLE_NAME", "my_table")
-    client_id = os.getenv("ZEROBUS_CLIENT_ID", "your_client_id")
-    client_secret = os.getenv("ZEROBUS_CLIENT_SECRET", "your_client_secret")
-    unity_catalog_url = os.getenv("UNITY_CATALOG_URL", "https://unity-catalog-url")
-
-    # Use async context manager for automatic cleanup
-    async with ZerobusWrapper(
-        endpoint=endpoint,
-        table_name=table_name,
-        client_id=client_id,
-        client_secret=client_secret,
-        unity_catalog_url=unity_catalog_url,
-    ) as wrapper:
-        # Create and send batch
-        schema = pa.schema(
-            [
-                pa.field("id", pa.int64()),
-                pa.field("name", pa.string()),
-            ]
+    """Example using a context manager."""
+    # The context manager shuts the wrapper down when the block exits
+    with open_wrapper() as wrapper:
+        # Create and send batch (zero-copy slices of the shared columns)
+        batch = pa.RecordBatch.from_arrays(
+            [_IDS.slice(0, 3), _NAMES.slice(0, 3)],
+            schema=_ID_NAME_SCHEMA,
         )
-        arrays = [
-            pa.array([1, 2, 3], type=pa.int64()),
-            pa.array(["Alice", "Bob", "Charlie"], type=pa.string()),
-        ]
-        batch = pa.RecordBatch.from_arrays(arrays, schema=schema)
 
         result = wrapper.send_batch(batch)
-        print(f"Result: success={result.success}, latency={result.latency_ms}ms")
+        logger.info(
+            "Result: success=%s, latency=%sms", result.success, result.latency_ms
+        )
+
+
+def main_batched(num_batches=10):
+    """Example sending many batches with a single, blocking send_batches call."""
+    wrapper = ZerobusWrapper(make_config())
+    try:
+        batches = [
+            pa.RecordBatch.from_arrays([_IDS, _NAMES, _SCORES], schema=_SCHEMA)
+            for _ in range(num_batches)
+        ]
+
+        # One call converts and transmits every batch, instead of one
+        # Python-to-Rust crossing (and runtime entry) per send_batch call
+        results = wrapper.send_batches(batches)
+        succeeded = sum(1 for result in results if result.success)
+        logger.info("Sent %d batches, %d succeeded", len(results), succeeded)
+    finally:
+        wrapper.shutdown()
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.environ.get("LOGLEVEL", "WARNING"))
+
     # Run the main example
     asyncio.run(main())
 
     # Or use context manager
     # asyncio.run(main_with_context_manager())
+
+    # Or send many batches in a single call
+    # main_batched()
@@ -41,7 +41,7 @@ fi
 # Install/upgrade required packages
 echo "Installing Python test dependencies..."
 $PYTHON_EXEC -m pip install --upgrade pip --quiet
-$PYTHON_EXEC -m pip install pytest pytest-cov pytest-forked --quiet
+$PYTHON_EXEC -m pip install numpy pytest pytest-asyncio pytest-cov pytest-forked pytest-xdist --quiet
 
 # Check if maturin is needed to build the extension
 if [ ! -f "target/release/libarrow_zerobus_sdk_wrapper.so" ] && [ ! -f "target/release/libarrow_zerobus_sdk_wrapper.dylib" ]; then
@@ -54,8 +54,9 @@ if [ ! -f "target/release/libarrow_zerobus_sdk_wrapper.so" ] && [ ! -f "target/r
 fi
 
 echo "Running Python tests with PyO3 workaround..."
-echo "Command: pytest tests/python/ -v --forked $@"
+echo "Command: pytest -n auto tests/python/ -v $@"
 
-# Run pytest with forked execution to prevent GIL issues
-$PYTHON_EXEC -m pytest tests/python/ -v --forked "$@"
+# Tests marked @pytest.mark.forked run in their own process to prevent GIL issues
+# and the suite is sharded across all cores with pytest-xdist
+$PYTHON_EXEC -m pytest -n auto tests/python/ -v "$@"
 
@@ -74,4 +74,21 @@ impl ZerobusError {
     pub fn is_token_expired(&self) -> bool {
         matches!(self, ZerobusError::AuthenticationError(_))
     }
+
+    /// Get the error type name for this error
+    ///
+    /// Returns the variant name (e.g., "ConversionError") as a static string, so
+    /// callers that classify many errors (such as per-row error analysis) can
+    /// group and count by type without allocating a `String` per error.
+    pub fn error_type(&self) -> &'static str {
+        match self {
+            ZerobusError::ConfigurationError(_) => "ConfigurationError",
+            ZerobusError::AuthenticationError(_) => "AuthenticationError",
+            ZerobusError::ConnectionError(_) => "ConnectionError",
+            ZerobusError::ConversionError(_) => "ConversionError",
+            ZerobusError::TransmissionError(_) => "TransmissionError",
+            ZerobusError::RetryExhausted(_) => "RetryExhausted",
+            ZerobusError::TokenRefreshError(_) => "TokenRefreshError",
+        }
+    }
 }
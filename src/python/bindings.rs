@@ -11,31 +11,37 @@ use crate::config::OtlpSdkConfig;
 use crate::config::WrapperConfiguration;
 use crate::error::ZerobusError;
 use crate::wrapper::{TransmissionResult, ZerobusWrapper};
+use arrow::array::Array;
 use arrow::datatypes::DataType;
 use arrow::record_batch::RecordBatch;
-use pyo3::exceptions::{PyException, PyNotImplementedError, PyTypeError};
+use pyo3::exceptions::{PyException, PyNotImplementedError, PyRuntimeError, PyTypeError};
 use pyo3::prelude::*;
-use pyo3::types::{PyDict, PyModule};
+use pyo3::sync::GILOnceCell;
+use pyo3::types::{PyCapsule, PyDict, PyList, PyModule, PyString, PyTuple, PyType};
 use std::collections::HashMap;
 use std::path::PathBuf;
-use std::sync::Arc;
+use std::sync::{Arc, Mutex, OnceLock};
 use tokio::runtime::Runtime;
 
 /// Register all Python classes and functions in the module
-pub fn register_module(_py: Python, m: &PyModule) -> PyResult<()> {
+pub fn register_module(py: Python, m: &PyModule) -> PyResult<()> {
     m.add_class::<PyZerobusWrapper>()?;
     m.add_class::<PyTransmissionResult>()?;
+    m.add_class::<PyTransmissionAnalysis>()?;
     m.add_class::<PyWrapperConfiguration>()?;
 
-    // Register exception classes - base class must be registered first
-    m.add_class::<PyZerobusError>()?;
-    m.add_class::<PyConfigurationError>()?;
-    m.add_class::<PyAuthenticationError>()?;
-    m.add_class::<PyConnectionError>()?;
-    m.add_class::<PyConversionError>()?;
-    m.add_class::<PyTransmissionError>()?;
-    m.add_class::<PyRetryExhausted>()?;
-    m.add_class::<PyTokenRefreshError>()?;
+    // Register exception classes - all subclass ZerobusError
+    m.add("ZerobusError", py.get_type::<PyZerobusError>())?;
+    m.add("ConfigurationError", py.get_type::<PyConfigurationError>())?;
+    m.add(
+        "AuthenticationError",
+        py.get_type::<PyAuthenticationError>(),
+    )?;
+    m.add("ConnectionError", py.get_type::<PyConnectionError>())?;
+    m.add("ConversionError", py.get_type::<PyConversionError>())?;
+    m.add("TransmissionError", py.get_type::<PyTransmissionError>())?;
+    m.add("RetryExhausted", py.get_type::<PyRetryExhausted>())?;
+    m.add("TokenRefreshError", py.get_type::<PyTokenRefreshError>())?;
 
     Ok(())
 }
@@ -121,197 +127,70 @@ fn parse_error_string(error_msg: String) -> ZerobusError {
 }
 
 // Exception classes
-// Note: In PyO3, all custom exceptions must extend PyException directly.
-// We cannot use a custom base class (PyZerobusError) for other exceptions
-// because PyO3 doesn't support that pattern. Instead, all exceptions extend
-// PyException directly, but they're logically grouped as ZerobusError exceptions.
-#[pyclass(name = "ZerobusError", extends=PyException)]
-#[derive(Debug)]
-pub struct PyZerobusError;
-
-#[pymethods]
-impl PyZerobusError {
-    // Base exception class for Zerobus errors
-}
-
-// Exception classes with message storage for Python construction
-#[pyclass(name = "ConfigurationError", extends=PyException)]
-#[derive(Debug)]
-pub struct PyConfigurationError {
-    message: String,
-}
-
-#[pyclass(name = "AuthenticationError", extends=PyException)]
-#[derive(Debug)]
-pub struct PyAuthenticationError {
-    message: String,
-}
-
-#[pyclass(name = "ConnectionError", extends=PyException)]
-#[derive(Debug)]
-pub struct PyConnectionError {
-    message: String,
-}
-
-#[pyclass(name = "ConversionError", extends=PyException)]
-#[derive(Debug)]
-pub struct PyConversionError {
-    message: String,
-}
-
-#[pyclass(name = "TransmissionError", extends=PyException)]
-#[derive(Debug)]
-pub struct PyTransmissionError {
-    message: String,
-}
-
-#[pyclass(name = "RetryExhausted", extends=PyException)]
-#[derive(Debug)]
-pub struct PyRetryExhausted {
-    message: String,
+// Created with create_exception!, which registers each type through
+// PyErr_NewExceptionWithDoc once per interpreter and caches the type object.
+// Every error subclasses ZerobusError, so `except ZerobusError` catches all of
+// them, and raising one is a plain CPython exception with no pyclass state.
+mod exceptions {
+    use pyo3::create_exception;
+    use pyo3::exceptions::PyException;
+
+    create_exception!(
+        arrow_zerobus_sdk_wrapper,
+        ZerobusError,
+        PyException,
+        "Base class for all Zerobus wrapper errors."
+    );
+    create_exception!(
+        arrow_zerobus_sdk_wrapper,
+        ConfigurationError,
+        ZerobusError,
+        "Invalid or incomplete wrapper configuration."
+    );
+    create_exception!(
+        arrow_zerobus_sdk_wrapper,
+        AuthenticationError,
+        ZerobusError,
+        "OAuth2 authentication with Databricks failed."
+    );
+    create_exception!(
+        arrow_zerobus_sdk_wrapper,
+        ConnectionError,
+        ZerobusError,
+        "Connecting to the Zerobus endpoint failed."
+    );
+    create_exception!(
+        arrow_zerobus_sdk_wrapper,
+        ConversionError,
+        ZerobusError,
+        "Converting Arrow data to Protobuf failed."
+    );
+    create_exception!(
+        arrow_zerobus_sdk_wrapper,
+        TransmissionError,
+        ZerobusError,
+        "Sending data to Zerobus failed."
+    );
+    create_exception!(
+        arrow_zerobus_sdk_wrapper,
+        RetryExhausted,
+        ZerobusError,
+        "All retry attempts for a transient failure were used up."
+    );
+    create_exception!(
+        arrow_zerobus_sdk_wrapper,
+        TokenRefreshError,
+        ZerobusError,
+        "Refreshing the authentication token failed."
+    );
 }
 
-#[pyclass(name = "TokenRefreshError", extends=PyException)]
-#[derive(Debug)]
-pub struct PyTokenRefreshError {
-    message: String,
-}
-
-// Internal helper methods for creating PyErr from Rust
-// These are used by rust_error_to_python_error to convert Rust errors to Python exceptions
-#[allow(dead_code)] // Used indirectly via rust_error_to_python_error
-impl PyConfigurationError {
-    fn new_err(msg: String) -> PyErr {
-        PyErr::new::<PyConfigurationError, _>(msg)
-    }
-}
-
-#[allow(dead_code)] // Used indirectly via rust_error_to_python_error
-impl PyAuthenticationError {
-    fn new_err(msg: String) -> PyErr {
-        PyErr::new::<PyAuthenticationError, _>(msg)
-    }
-}
-
-#[allow(dead_code)] // Used indirectly via rust_error_to_python_error
-impl PyConnectionError {
-    fn new_err(msg: String) -> PyErr {
-        PyErr::new::<PyConnectionError, _>(msg)
-    }
-}
-
-#[allow(dead_code)] // Used indirectly via rust_error_to_python_error
-impl PyConversionError {
-    fn new_err(msg: String) -> PyErr {
-        PyErr::new::<PyConversionError, _>(msg)
-    }
-}
-
-#[allow(dead_code)] // Used indirectly via rust_error_to_python_error
-impl PyTransmissionError {
-    fn new_err(msg: String) -> PyErr {
-        PyErr::new::<PyTransmissionError, _>(msg)
-    }
-}
-
-#[allow(dead_code)] // Used indirectly via rust_error_to_python_error
-impl PyRetryExhausted {
-    fn new_err(msg: String) -> PyErr {
-        PyErr::new::<PyRetryExhausted, _>(msg)
-    }
-}
-
-#[allow(dead_code)] // Used indirectly via rust_error_to_python_error
-impl PyTokenRefreshError {
-    fn new_err(msg: String) -> PyErr {
-        PyErr::new::<PyTokenRefreshError, _>(msg)
-    }
-}
-
-// Python constructors for error classes
-#[pymethods]
-impl PyConfigurationError {
-    #[new]
-    fn new(msg: String) -> Self {
-        Self { message: msg }
-    }
-
-    fn __str__(&self) -> &str {
-        &self.message
-    }
-}
-
-#[pymethods]
-impl PyAuthenticationError {
-    #[new]
-    fn new(msg: String) -> Self {
-        Self { message: msg }
-    }
-
-    fn __str__(&self) -> &str {
-        &self.message
-    }
-}
-
-#[pymethods]
-impl PyConnectionError {
-    #[new]
-    fn new(msg: String) -> Self {
-        Self { message: msg }
-    }
-
-    fn __str__(&self) -> &str {
-        &self.message
-    }
-}
-
-#[pymethods]
-impl PyConversionError {
-    #[new]
-    fn new(msg: String) -> Self {
-        Self { message: msg }
-    }
-
-    fn __str__(&self) -> &str {
-        &self.message
-    }
-}
-
-#[pymethods]
-impl PyTransmissionError {
-    #[new]
-    fn new(msg: String) -> Self {
-        Self { message: msg }
-    }
-
-    fn __str__(&self) -> &str {
-        &self.message
-    }
-}
-
-#[pymethods]
-impl PyRetryExhausted {
-    #[new]
-    fn new(msg: String) -> Self {
-        Self { message: msg }
-    }
-
-    fn __str__(&self) -> &str {
-        &self.message
-    }
-}
-
-#[pymethods]
-impl PyTokenRefreshError {
-    #[new]
-    fn new(msg: String) -> Self {
-        Self { message: msg }
-    }
-
-    fn __str__(&self) -> &str {
-        &self.message
-    }
-}
+pub use exceptions::{
+    AuthenticationError as PyAuthenticationError, ConfigurationError as PyConfigurationError,
+    ConnectionError as PyConnectionError, ConversionError as PyConversionError,
+    RetryExhausted as PyRetryExhausted, TokenRefreshError as PyTokenRefreshError,
+    TransmissionError as PyTransmissionError, ZerobusError as PyZerobusError,
+};
 
 /// Python wrapper for WrapperConfiguration
 #[pyclass(name = "WrapperConfiguration")]
@@ -472,6 +351,30 @@ impl PyWrapperConfiguration {
         Ok(Self { inner: config })
     }
 
+    /// Construct and validate a WrapperConfiguration in a single call.
+    ///
+    /// Takes the same arguments as the constructor and returns a configuration
+    /// that has already passed validate(), saving the second call into the
+    /// extension module. Prefer this over `WrapperConfiguration(...)` followed
+    /// by `.validate()`.
+    ///
+    /// Raises:
+    ///     ConfigurationError: If the configuration is invalid
+    #[classmethod]
+    #[pyo3(signature = (*args, **kwargs))]
+    fn new_validated(cls: &PyType, args: &PyTuple, kwargs: Option<&PyDict>) -> PyResult<Py<Self>> {
+        let config: &PyCell<Self> = cls.call(args, kwargs)?.downcast()?;
+        config.borrow().validate()?;
+        Ok(config.into())
+    }
+
+    /// Validate the configuration.
+    ///
+    /// Kept for configurations built with the constructor; new code should use
+    /// WrapperConfiguration.new_validated().
+    ///
+    /// Raises:
+    ///     ConfigurationError: If the configuration is invalid
     fn validate(&self) -> PyResult<()> {
         self.inner.validate().map_err(rust_error_to_python_error)?;
         Ok(())
@@ -567,6 +470,65 @@ pub struct PyTransmissionResult {
     // Made pub for tests (which are in a separate crate)
     #[allow(dead_code)] // Used in tests
     pub inner: TransmissionResult,
+    /// Per-error-type breakdown, computed once since results are immutable
+    error_analysis: Arc<ErrorAnalysis>,
+}
+
+/// Shared analysis for results without failed rows, so fully successful
+/// batches skip building any per-error structures
+static EMPTY_ERROR_ANALYSIS: OnceLock<Arc<ErrorAnalysis>> = OnceLock::new();
+
+impl From<TransmissionResult> for PyTransmissionResult {
+    fn from(inner: TransmissionResult) -> Self {
+        let error_analysis = if inner.has_failed_rows() {
+            Arc::new(ErrorAnalysis::new(&inner))
+        } else {
+            Arc::clone(EMPTY_ERROR_ANALYSIS.get_or_init(Default::default))
+        };
+        Self {
+            inner,
+            error_analysis,
+        }
+    }
+}
+
+/// Failed rows grouped by error type, precomputed for the Python accessors
+#[derive(Default)]
+struct ErrorAnalysis {
+    /// Row indices for each error type, in failed_rows order
+    indices_by_type: HashMap<String, Vec<usize>>,
+    /// Number of failed rows for each error type
+    type_counts: HashMap<String, usize>,
+    /// Formatted error messages, already converted to Python strings
+    messages: Vec<Py<PyString>>,
+}
+
+impl ErrorAnalysis {
+    fn new(result: &TransmissionResult) -> Self {
+        let indices_by_type = result.group_errors_by_type();
+        let type_counts = indices_by_type
+            .iter()
+            .map(|(error_type, indices)| (error_type.clone(), indices.len()))
+            .collect();
+
+        let messages = Python::with_gil(|py| {
+            let mut messages = Vec::with_capacity(result.failed_count);
+            if let Some(failed_rows) = &result.failed_rows {
+                messages.extend(
+                    failed_rows
+                        .iter()
+                        .map(|(_, error)| PyString::new(py, &error.to_string()).into()),
+                );
+            }
+            messages
+        });
+
+        Self {
+            indices_by_type,
+            type_counts,
+            messages,
+        }
+    }
 }
 
 #[pymethods]
@@ -611,20 +573,19 @@ impl PyTransmissionResult {
         // Convert string error to ZerobusError
         let rust_error = error.map(parse_error_string);
 
-        Self {
-            inner: TransmissionResult {
-                success,
-                error: rust_error,
-                attempts,
-                latency_ms,
-                batch_size_bytes,
-                failed_rows: rust_failed_rows,
-                successful_rows,
-                total_rows,
-                successful_count,
-                failed_count,
-            },
+        TransmissionResult {
+            success,
+            error: rust_error,
+            attempts,
+            latency_ms,
+            batch_size_bytes,
+            failed_rows: rust_failed_rows,
+            successful_rows,
+            total_rows,
+            successful_count,
+            failed_count,
         }
+        .into()
     }
 
     #[getter]
@@ -655,23 +616,27 @@ impl PyTransmissionResult {
     /// Get failed rows with their errors
     ///
     /// Returns a list of tuples (row_index, error_message) for rows that failed.
-    /// Returns None if all rows succeeded.
+    /// Returns an empty list if all rows succeeded.
     #[getter]
-    pub fn failed_rows(&self) -> Option<Vec<(usize, String)>> {
-        self.inner.failed_rows.as_ref().map(|rows| {
-            rows.iter()
-                .map(|(idx, error)| (*idx, error.to_string()))
-                .collect()
-        })
+    pub fn failed_rows(&self, py: Python) -> Vec<(usize, Py<PyString>)> {
+        // Messages were formatted once when the result was built; reuse them
+        // instead of formatting every error again on each access
+        self.inner
+            .failed_rows
+            .iter()
+            .flatten()
+            .zip(&self.error_analysis.messages)
+            .map(|((idx, _), message)| (*idx, message.clone_ref(py)))
+            .collect()
     }
 
     /// Get indices of successfully written rows
     ///
     /// Returns a list of row indices that were successfully written.
-    /// Returns None if all rows failed.
+    /// Returns an empty list if all rows failed.
     #[getter]
-    pub fn successful_rows(&self) -> Option<Vec<usize>> {
-        self.inner.successful_rows.clone()
+    pub fn successful_rows(&self) -> Vec<usize> {
+        self.inner.successful_rows.clone().unwrap_or_default()
     }
 
     /// Get total number of rows in the batch
@@ -699,6 +664,24 @@ impl PyTransmissionResult {
         self.inner.get_failed_row_indices()
     }
 
+    /// Get indices of failed rows as a PyArrow array
+    ///
+    /// Same indices as get_failed_row_indices(), but handed to PyArrow as one
+    /// contiguous buffer instead of a list of Python ints. Use
+    /// `.to_numpy()` for NumPy or `.to_pylist()` for a list.
+    ///
+    /// Returns:
+    ///     pyarrow.Int64Array of failed row indices (empty if none failed).
+    pub fn get_failed_row_indices_array(&self, py: Python) -> PyResult<PyObject> {
+        let indices = arrow::array::Int64Array::from_iter_values(
+            self.inner
+                .get_failed_row_indices()
+                .into_iter()
+                .map(|idx| idx as i64),
+        );
+        rust_array_to_pyarrow(py, &indices)
+    }
+
     /// Get indices of successful rows
     ///
     /// Returns a list of row indices that succeeded, or empty list if none succeeded.
@@ -706,6 +689,25 @@ impl PyTransmissionResult {
         self.inner.get_successful_row_indices()
     }
 
+    /// Get indices of successful rows as a PyArrow array
+    ///
+    /// Same indices as get_successful_row_indices(), but handed to PyArrow as
+    /// one contiguous buffer instead of a list of Python ints. Use
+    /// `.to_numpy()` for NumPy or `.to_pylist()` for a list.
+    ///
+    /// Returns:
+    ///     pyarrow.Int64Array of successful row indices (empty if none succeeded).
+    pub fn get_successful_row_indices_array(&self, py: Python) -> PyResult<PyObject> {
+        let indices = arrow::array::Int64Array::from_iter_values(
+            self.inner
+                .successful_rows
+                .iter()
+                .flatten()
+                .map(|&idx| idx as i64),
+        );
+        rust_array_to_pyarrow(py, &indices)
+    }
+
     /// Extract a RecordBatch containing only the failed rows from the original batch
     ///
     /// Args:
@@ -756,6 +758,33 @@ impl PyTransmissionResult {
         }
     }
 
+    /// Split the original batch into its failed and successful rows
+    ///
+    /// Same result as extract_failed_batch() followed by
+    /// extract_successful_batch(), but the batch is imported from Python once
+    /// instead of once per call.
+    ///
+    /// Args:
+    ///     original_batch: The original PyArrow RecordBatch that was sent
+    ///
+    /// Returns:
+    ///     Tuple (failed_batch, successful_batch); either is None if it would have no rows.
+    pub fn split_batch(
+        &self,
+        py: Python,
+        original_batch: PyObject,
+    ) -> PyResult<(Option<PyObject>, Option<PyObject>)> {
+        let rust_batch = pyarrow_to_rust_batch(py, original_batch)?;
+        let (failed, successful) = self.inner.split_batch(&rust_batch);
+
+        let to_py = |batch: Option<RecordBatch>| {
+            batch
+                .map(|batch| rust_batch_to_pyarrow(py, &batch))
+                .transpose()
+        };
+        Ok((to_py(failed)?, to_py(successful)?))
+    }
+
     /// Get indices of failed rows filtered by error type
     ///
     /// Args:
@@ -765,17 +794,37 @@ impl PyTransmissionResult {
     /// Returns:
     ///     List of row indices for failed rows that match the error type.
     pub fn get_failed_row_indices_by_error_type(&self, error_type: &str) -> Vec<usize> {
-        self.inner
-            .get_failed_row_indices_by_error_type(|error| match error_type {
-                "ConversionError" => matches!(error, ZerobusError::ConversionError(_)),
-                "TransmissionError" => matches!(error, ZerobusError::TransmissionError(_)),
-                "ConnectionError" => matches!(error, ZerobusError::ConnectionError(_)),
-                "AuthenticationError" => matches!(error, ZerobusError::AuthenticationError(_)),
-                "ConfigurationError" => matches!(error, ZerobusError::ConfigurationError(_)),
-                "RetryExhausted" => matches!(error, ZerobusError::RetryExhausted(_)),
-                "TokenRefreshError" => matches!(error, ZerobusError::TokenRefreshError(_)),
-                _ => false,
-            })
+        self.error_analysis
+            .indices_by_type
+            .get(error_type)
+            .cloned()
+            .unwrap_or_default()
+    }
+
+    /// Get indices of failed rows filtered by error type as a PyArrow array
+    ///
+    /// Same indices as get_failed_row_indices_by_error_type(), handed to
+    /// PyArrow as one contiguous buffer instead of a list of Python ints.
+    ///
+    /// Args:
+    ///     error_type: String representing the error type to filter by
+    ///
+    /// Returns:
+    ///     pyarrow.Int64Array of matching failed row indices (empty if none match).
+    pub fn get_failed_row_indices_by_error_type_array(
+        &self,
+        py: Python,
+        error_type: &str,
+    ) -> PyResult<PyObject> {
+        let indices = arrow::array::Int64Array::from_iter_values(
+            self.error_analysis
+                .indices_by_type
+                .get(error_type)
+                .into_iter()
+                .flatten()
+                .map(|&idx| idx as i64),
+        );
+        rust_array_to_pyarrow(py, &indices)
     }
 
     /// Check if this result represents a partial success (some rows succeeded, some failed)
@@ -807,7 +856,43 @@ impl PyTransmissionResult {
     /// Returns:
     ///     Dictionary mapping error type names to lists of row indices.
     pub fn group_errors_by_type(&self) -> HashMap<String, Vec<usize>> {
-        self.inner.group_errors_by_type()
+        self.error_analysis.indices_by_type.clone()
+    }
+
+    /// Group failed rows by error type in a columnar layout
+    ///
+    /// Carries the same information as group_errors_by_type(), but all row
+    /// indices share one buffer, so results from many batches can be merged
+    /// with pyarrow.concat_arrays or numpy.concatenate instead of per-list work.
+    ///
+    /// Returns:
+    ///     Tuple (types, indices, offsets): error type names sorted by name, a
+    ///     pyarrow.Int64Array of row indices grouped by type, and a
+    ///     pyarrow.Int64Array of len(types) + 1 offsets where the indices for
+    ///     types[i] are indices[offsets[i]:offsets[i + 1]].
+    pub fn errors_by_type_columnar(
+        &self,
+        py: Python,
+    ) -> PyResult<(Vec<String>, PyObject, PyObject)> {
+        let mut groups: Vec<_> = self.error_analysis.indices_by_type.iter().collect();
+        groups.sort_unstable_by(|a, b| a.0.cmp(b.0));
+
+        let mut types = Vec::with_capacity(groups.len());
+        let mut indices = Vec::with_capacity(self.inner.failed_count);
+        let mut offsets = Vec::with_capacity(groups.len() + 1);
+        offsets.push(0i64);
+        for (error_type, rows) in groups {
+            types.push(error_type.clone());
+            indices.extend(rows.iter().map(|&idx| idx as i64));
+            offsets.push(indices.len() as i64);
+        }
+
+        // Int64 like the other *_array getters, so large batches cannot wrap
+        Ok((
+            types,
+            rust_array_to_pyarrow(py, &arrow::array::Int64Array::from(indices))?,
+            rust_array_to_pyarrow(py, &arrow::array::Int64Array::from(offsets))?,
+        ))
     }
 
     /// Get error statistics for this transmission result
@@ -821,30 +906,128 @@ impl PyTransmissionResult {
     ///     - failure_rate: Failure rate (0.0 to 1.0)
     ///     - error_type_counts: Dictionary mapping error types to counts
     pub fn get_error_statistics(&self, py: Python) -> PyResult<PyObject> {
-        let stats = self.inner.get_error_statistics();
+        Ok(self.error_statistics_dict(py)?.to_object(py))
+    }
+
+    /// Get all error messages from failed rows
+    ///
+    /// Returns:
+    ///     List of error message strings for all failed rows.
+    pub fn get_error_messages(&self, py: Python) -> Py<PyList> {
+        // Messages are formatted once at construction; only the list is new
+        PyList::new(
+            py,
+            self.error_analysis
+                .messages
+                .iter()
+                .map(|message| message.clone_ref(py)),
+        )
+        .into()
+    }
+
+    /// Get the complete row-level analysis of this result in a single call
+    ///
+    /// Equivalent to calling is_partial_success(), get_failed_row_indices(),
+    /// get_error_statistics(), group_errors_by_type() and get_error_messages()
+    /// individually, but crosses into Rust only once.
+    ///
+    /// Returns:
+    ///     TransmissionAnalysis with partial, failed_indices, statistics,
+    ///     grouped_errors and messages attributes.
+    pub fn analyze(&self, py: Python) -> PyResult<PyTransmissionAnalysis> {
+        Ok(PyTransmissionAnalysis {
+            partial: self.inner.is_partial_success(),
+            failed_indices: PyList::new(py, self.inner.get_failed_row_indices()).into(),
+            statistics: self.error_statistics_dict(py)?.into(),
+            grouped_errors: self.group_errors_by_type().into_py(py),
+            messages: self.get_error_messages(py),
+        })
+    }
+}
+
+impl PyTransmissionResult {
+    /// Build the dictionary returned by get_error_statistics()
+    fn error_statistics_dict<'py>(&self, py: Python<'py>) -> PyResult<&'py PyDict> {
+        let (success_rate, failure_rate) = if self.inner.total_rows > 0 {
+            let total_rows = self.inner.total_rows as f64;
+            (
+                self.inner.successful_count as f64 / total_rows,
+                self.inner.failed_count as f64 / total_rows,
+            )
+        } else {
+            (0.0, 0.0)
+        };
+
         let dict = PyDict::new(py);
-        dict.set_item("total_rows", stats.total_rows)?;
-        dict.set_item("successful_count", stats.successful_count)?;
-        dict.set_item("failed_count", stats.failed_count)?;
-        dict.set_item("success_rate", stats.success_rate)?;
-        dict.set_item("failure_rate", stats.failure_rate)?;
+        dict.set_item("total_rows", self.inner.total_rows)?;
+        dict.set_item("successful_count", self.inner.successful_count)?;
+        dict.set_item("failed_count", self.inner.failed_count)?;
+        dict.set_item("success_rate", success_rate)?;
+        dict.set_item("failure_rate", failure_rate)?;
 
+        // Error type counts come from the analysis computed at construction
         let error_type_counts = PyDict::new(py);
-        for (error_type, count) in stats.error_type_counts {
+        for (error_type, count) in &self.error_analysis.type_counts {
             error_type_counts.set_item(error_type, count)?;
         }
         dict.set_item("error_type_counts", error_type_counts)?;
 
-        Ok(dict.to_object(py))
+        Ok(dict)
     }
+}
 
-    /// Get all error messages from failed rows
-    ///
-    /// Returns:
-    ///     List of error message strings for all failed rows.
-    pub fn get_error_messages(&self) -> Vec<String> {
-        self.inner.get_error_messages()
+/// Row-level analysis of a TransmissionResult, returned by analyze()
+///
+/// All attributes are computed once when the analysis is created.
+#[pyclass(name = "TransmissionAnalysis")]
+pub struct PyTransmissionAnalysis {
+    /// True if some rows succeeded and some failed
+    #[pyo3(get)]
+    partial: bool,
+    /// Indices of failed rows
+    #[pyo3(get)]
+    failed_indices: Py<PyList>,
+    /// Same dictionary as TransmissionResult.get_error_statistics()
+    #[pyo3(get)]
+    statistics: Py<PyDict>,
+    /// Same dictionary as TransmissionResult.group_errors_by_type()
+    #[pyo3(get)]
+    grouped_errors: PyObject,
+    /// Same list as TransmissionResult.get_error_messages()
+    #[pyo3(get)]
+    messages: Py<PyList>,
+}
+
+/// Tokio runtime shared by every ZerobusWrapper in the process, with the id of
+/// the process that created it
+static SHARED_RUNTIME: Mutex<Option<(u32, &'static Runtime)>> = Mutex::new(None);
+
+/// Get the process-wide Tokio runtime, creating it on first use
+///
+/// One multi-threaded runtime (one worker per core) serves all wrappers, so
+/// creating many wrappers does not multiply worker thread pools.
+///
+/// A forked child inherits the runtime but not its worker threads, so a
+/// runtime created by another process is replaced with a fresh one. The
+/// inherited runtime is leaked rather than dropped: shutting it down would wait
+/// on threads that do not exist in the child.
+fn shared_runtime() -> PyResult<&'static Runtime> {
+    let pid = std::process::id();
+    let mut shared = SHARED_RUNTIME
+        .lock()
+        .unwrap_or_else(|poisoned| poisoned.into_inner());
+    if let Some((owner, runtime)) = *shared {
+        if owner == pid {
+            return Ok(runtime);
+        }
     }
+    let runtime = tokio::runtime::Builder::new_multi_thread()
+        .enable_all()
+        .build()
+        .map_err(|e| PyException::new_err(format!("Failed to create Tokio runtime: {}", e)))?;
+    let runtime: &'static Runtime = Box::leak(Box::new(runtime));
+    *shared = Some((pid, runtime));
+    Ok(runtime)
 }
 
 /// Python wrapper for ZerobusWrapper
@@ -855,30 +1038,29 @@ impl PyTransmissionResult {
 #[allow(non_local_definitions)]
 pub struct PyZerobusWrapper {
     inner: Arc<ZerobusWrapper>,
-    runtime: Arc<Runtime>,
+    runtime: &'static Runtime,
+    /// Process that created the wrapper; its runtime is unusable after a fork
+    pid: u32,
 }
 
 #[pymethods]
 impl PyZerobusWrapper {
     #[new]
-    fn new(config: PyWrapperConfiguration) -> PyResult<Self> {
+    fn new(py: Python, config: PyWrapperConfiguration) -> PyResult<Self> {
         // Validate configuration
         config.validate()?;
 
-        // Create Tokio runtime for async operations
-        let runtime = Runtime::new()
-            .map_err(|e| PyException::new_err(format!("Failed to create Tokio runtime: {}", e)))?;
+        let runtime = shared_runtime()?;
 
-        // Initialize wrapper
-        let wrapper = runtime.block_on(async {
-            ZerobusWrapper::new(config.inner.clone())
-                .await
-                .map_err(rust_error_to_python_error)
-        })?;
+        // Initialize wrapper (may authenticate over the network, so without the GIL)
+        let wrapper = py
+            .allow_threads(|| runtime.block_on(ZerobusWrapper::new(config.inner.clone())))
+            .map_err(rust_error_to_python_error)?;
 
         Ok(Self {
             inner: Arc::new(wrapper),
-            runtime: Arc::new(runtime),
+            runtime,
+            pid: std::process::id(),
         })
     }
 
@@ -888,38 +1070,132 @@ impl PyZerobusWrapper {
     /// with automatic retry on transient failures.
     ///
     /// Args:
-    ///     batch: PyArrow RecordBatch to send
+    ///     batch: PyArrow RecordBatch, or any object implementing the Arrow
+    ///         PyCapsule interface (`__arrow_c_array__`), to send
     ///
     /// Returns:
     ///     TransmissionResult indicating success or failure
     ///
     /// Raises:
     ///     ZerobusError: If transmission fails after all retry attempts
+    #[pyo3(signature = (batch, /))]
     fn send_batch(&self, py: Python, batch: PyObject) -> PyResult<PyTransmissionResult> {
         // Convert PyArrow RecordBatch to Rust RecordBatch
         // This uses zero-copy conversion via PyArrow's C data interface
         let rust_batch = pyarrow_to_rust_batch(py, batch)?;
+        self.send_rust_batch(py, rust_batch)
+    }
 
-        // Execute async operation on Tokio runtime
-        let result = self
-            .runtime
-            .block_on(async { self.inner.send_batch(rust_batch).await });
+    /// Send a RecordBatch given directly as Arrow C Data Interface PyCapsules.
+    ///
+    /// Low-level entry point for callers that already hold the capsules, e.g.
+    /// `wrapper._send_batch_raw(*batch.__arrow_c_array__())`. Skips the
+    /// attribute lookup and type dispatch done by send_batch().
+    ///
+    /// Args:
+    ///     schema_capsule: "arrow_schema" PyCapsule describing a struct type
+    ///     array_capsule: "arrow_array" PyCapsule holding the struct array;
+    ///         its contents are moved out and it must not be reused
+    ///
+    /// Returns:
+    ///     TransmissionResult indicating success or failure
+    ///
+    /// Raises:
+    ///     ZerobusError: If transmission fails after all retry attempts
+    #[pyo3(signature = (schema_capsule, array_capsule, /))]
+    fn _send_batch_raw(
+        &self,
+        py: Python,
+        schema_capsule: &PyCapsule,
+        array_capsule: &PyCapsule,
+    ) -> PyResult<PyTransmissionResult> {
+        let rust_batch = record_batch_from_capsules(schema_capsule, array_capsule)?;
+        self.send_rust_batch(py, rust_batch)
+    }
 
-        match result {
-            Ok(transmission_result) => Ok(PyTransmissionResult {
-                inner: transmission_result,
-            }),
-            Err(e) => Err(rust_error_to_python_error(e)),
-        }
+    /// Send multiple Arrow RecordBatches to Zerobus in a single call.
+    ///
+    /// All batches are converted up front and then transmitted in order within a
+    /// single entry into the Tokio runtime, amortizing the per-call Python/Rust
+    /// crossing for producers that send many batches.
+    ///
+    /// Args:
+    ///     batches: List of PyArrow RecordBatches to send
+    ///
+    /// Returns:
+    ///     List of TransmissionResult, one per batch, in input order
+    ///
+    /// Raises:
+    ///     ZerobusError: If a batch fails after all retry attempts. Batches before
+    ///         the failing one have already been transmitted.
+    #[pyo3(signature = (batches, /))]
+    fn send_batches(
+        &self,
+        py: Python,
+        batches: Vec<PyObject>,
+    ) -> PyResult<Vec<PyTransmissionResult>> {
+        let rust_batches = batches
+            .into_iter()
+            .map(|batch| pyarrow_to_rust_batch(py, batch))
+            .collect::<PyResult<Vec<_>>>()?;
+        self.send_rust_batches(py, rust_batches)
+    }
+
+    /// Send RecordBatches serialized in the Arrow IPC streaming format.
+    ///
+    /// Lets callers that send the same data repeatedly (benchmarks, retries
+    /// driven from Python) serialize once with `pyarrow.ipc.new_stream` and pass
+    /// the bytes on every call. Every batch in the stream is sent in order, as
+    /// with send_batches().
+    ///
+    /// Args:
+    ///     buf: Arrow IPC stream bytes (schema message followed by batches)
+    ///
+    /// Returns:
+    ///     List of TransmissionResult, one per batch in the stream
+    ///
+    /// Raises:
+    ///     ConversionError: If buf is not a valid Arrow IPC stream
+    ///     ZerobusError: If a batch fails after all retry attempts
+    #[pyo3(signature = (buf, /))]
+    fn send_serialized(&self, py: Python, buf: &[u8]) -> PyResult<Vec<PyTransmissionResult>> {
+        let rust_batches = arrow::ipc::reader::StreamReader::try_new(buf, None)
+            .and_then(|reader| reader.collect::<Result<Vec<_>, _>>())
+            .map_err(|e| {
+                PyConversionError::new_err(format!("Failed to read Arrow IPC stream: {}", e))
+            })?;
+        self.send_rust_batches(py, rust_batches)
+    }
+
+    /// Build and cache the Protobuf descriptor for a schema ahead of sending.
+    ///
+    /// send_batch() builds the descriptor the first time it sees a schema and
+    /// reuses it for later batches with an equal schema; priming moves that
+    /// one-time cost out of the first send.
+    ///
+    /// Args:
+    ///     schema: PyArrow Schema of the batches that will be sent
+    ///
+    /// Returns:
+    ///     True if the descriptor was built by this call, False if it was already cached
+    ///
+    /// Raises:
+    ///     ConversionError: If no descriptor can be built for the schema
+    #[pyo3(signature = (schema, /))]
+    fn prime_schema(&self, schema: &PyAny) -> PyResult<bool> {
+        let schema = Arc::new(pyarrow_to_rust_schema(schema)?);
+        self.inner
+            .prime_schema(&schema)
+            .map_err(rust_error_to_python_error)
     }
 
     /// Flush any pending operations and ensure data is transmitted.
     ///
     /// Raises:
     ///     ZerobusError: If flush operation fails
-    fn flush(&self, _py: Python) -> PyResult<()> {
-        self.runtime
-            .block_on(async { self.inner.flush().await })
+    fn flush(&self, py: Python) -> PyResult<()> {
+        let runtime = self.runtime()?;
+        py.allow_threads(|| runtime.block_on(self.inner.flush()))
             .map_err(rust_error_to_python_error)?;
         Ok(())
     }
@@ -928,9 +1204,9 @@ impl PyZerobusWrapper {
     ///
     /// Raises:
     ///     ZerobusError: If shutdown fails
-    fn shutdown(&self, _py: Python) -> PyResult<()> {
-        self.runtime
-            .block_on(async { self.inner.shutdown().await })
+    fn shutdown(&self, py: Python) -> PyResult<()> {
+        let runtime = self.runtime()?;
+        py.allow_threads(|| runtime.block_on(self.inner.shutdown()))
             .map_err(rust_error_to_python_error)?;
         Ok(())
     }
@@ -953,28 +1229,99 @@ impl PyZerobusWrapper {
     }
 }
 
+impl PyZerobusWrapper {
+    /// The runtime this wrapper was created on
+    ///
+    /// A wrapper created before a fork cannot be used in the child: its
+    /// runtime's worker threads and its connections stayed in the parent.
+    fn runtime(&self) -> PyResult<&'static Runtime> {
+        if self.pid != std::process::id() {
+            return Err(PyRuntimeError::new_err(
+                "ZerobusWrapper was created in another process; create a new wrapper after fork",
+            ));
+        }
+        Ok(self.runtime)
+    }
+
+    /// Send an already converted batch on the Tokio runtime
+    ///
+    /// The GIL is released while the runtime drives the send, so other Python
+    /// threads (e.g. `asyncio.to_thread` workers) keep running during I/O.
+    fn send_rust_batch(&self, py: Python, batch: RecordBatch) -> PyResult<PyTransmissionResult> {
+        let runtime = self.runtime()?;
+        py.allow_threads(|| runtime.block_on(self.inner.send_batch(batch)))
+            .map(PyTransmissionResult::from)
+            .map_err(rust_error_to_python_error)
+    }
+
+    /// Send already converted batches in order within one runtime entry
+    fn send_rust_batches(
+        &self,
+        py: Python,
+        batches: Vec<RecordBatch>,
+    ) -> PyResult<Vec<PyTransmissionResult>> {
+        let runtime = self.runtime()?;
+        let results = py.allow_threads(|| {
+            runtime.block_on(async {
+                let mut results = Vec::with_capacity(batches.len());
+                for batch in batches {
+                    results.push(self.inner.send_batch(batch).await?);
+                }
+                Ok::<_, ZerobusError>(results)
+            })
+        });
+
+        results
+            .map(|results| {
+                results
+                    .into_iter()
+                    .map(PyTransmissionResult::from)
+                    .collect()
+            })
+            .map_err(rust_error_to_python_error)
+    }
+}
+
 impl Clone for PyZerobusWrapper {
     fn clone(&self) -> Self {
         Self {
             inner: Arc::clone(&self.inner),
-            runtime: Arc::clone(&self.runtime),
+            runtime: self.runtime,
+            pid: self.pid,
         }
     }
 }
 
+/// Cached `pyarrow.RecordBatch` class for the non-PyCapsule conversion path
+static PYARROW_RECORD_BATCH: GILOnceCell<PyObject> = GILOnceCell::new();
+
 /// Convert PyArrow RecordBatch to Rust RecordBatch
 ///
-/// Uses PyArrow's C data interface for efficient conversion when possible.
-/// Falls back to Python API extraction if C data interface is not available.
+/// Accepts any object implementing the Arrow PyCapsule interface
+/// (`__arrow_c_array__`), which is imported without copying. Older PyArrow
+/// RecordBatches use `_export_to_c`, and the Python API extraction is the last
+/// resort if neither C data interface path is available.
 fn pyarrow_to_rust_batch(py: Python, batch: PyObject) -> PyResult<RecordBatch> {
-    // Import PyArrow module
-    let pyarrow = PyModule::import(py, "pyarrow")?;
+    let batch_ref = batch.as_ref(py);
 
-    // Get RecordBatch class
-    let record_batch_class = pyarrow.getattr("RecordBatch")?;
+    // Prefer the Arrow PyCapsule interface (PyArrow >= 14 and other Arrow
+    // producers): it hands over the buffers without touching the pyarrow module
+    if batch_ref.hasattr("__arrow_c_array__")? {
+        return pyarrow_to_rust_batch_capsule(batch_ref);
+    }
+
+    // Get the pyarrow RecordBatch class, imported once per interpreter
+    let record_batch_class = PYARROW_RECORD_BATCH
+        .get_or_try_init(py, || {
+            Ok::<_, PyErr>(
+                PyModule::import(py, "pyarrow")?
+                    .getattr("RecordBatch")?
+                    .into(),
+            )
+        })?
+        .as_ref(py);
 
     // Check if the object is a RecordBatch
-    let batch_ref = batch.as_ref(py);
     if !batch_ref.is_instance(record_batch_class)? {
         return Err(PyTypeError::new_err(
             "Expected pyarrow.RecordBatch, got different type",
@@ -992,36 +1339,123 @@ fn pyarrow_to_rust_batch(py: Python, batch: PyObject) -> PyResult<RecordBatch> {
     pyarrow_to_rust_batch_python_api(py, batch_ref)
 }
 
-/// Convert PyArrow RecordBatch using C data interface (zero-copy when possible)
+/// Convert a RecordBatch exposed through the Arrow PyCapsule interface (zero-copy)
+///
+/// `__arrow_c_array__` returns a (schema, array) pair of PyCapsules describing
+/// the batch as a struct array.
+fn pyarrow_to_rust_batch_capsule(batch_ref: &PyAny) -> PyResult<RecordBatch> {
+    let (schema_capsule, array_capsule): (&PyCapsule, &PyCapsule) =
+        batch_ref.call_method0("__arrow_c_array__")?.extract()?;
+    record_batch_from_capsules(schema_capsule, array_capsule)
+}
+
+/// Convert a PyArrow Schema through the Arrow C Data Interface
+///
+/// Uses the `__arrow_c_schema__` PyCapsule when PyArrow provides it and falls
+/// back to `_export_to_c` on older versions.
+fn pyarrow_to_rust_schema(schema_ref: &PyAny) -> PyResult<arrow::datatypes::Schema> {
+    use arrow::datatypes::Schema;
+    use arrow::ffi::FFI_ArrowSchema;
+    use std::ptr::addr_of_mut;
+
+    let to_py_err =
+        |e: arrow::error::ArrowError| PyTypeError::new_err(format!("Invalid Arrow schema: {}", e));
+
+    if schema_ref.hasattr("__arrow_c_schema__")? {
+        let capsule: &PyCapsule = schema_ref.call_method0("__arrow_c_schema__")?.extract()?;
+        check_capsule_name(capsule, "arrow_schema")?;
+        // SAFETY: the capsule name was checked above; the schema is only borrowed
+        let ffi_schema = unsafe { &*(capsule.pointer() as *const FFI_ArrowSchema) };
+        return Schema::try_from(ffi_schema).map_err(to_py_err);
+    }
+
+    let mut ffi_schema = FFI_ArrowSchema::empty();
+    schema_ref.call_method1("_export_to_c", (addr_of_mut!(ffi_schema) as usize,))?;
+    Schema::try_from(&ffi_schema).map_err(to_py_err)
+}
+
+/// Build a RecordBatch from Arrow C Data Interface PyCapsules
 ///
-/// Uses PyArrow's IPC serialization as an efficient intermediate format.
-/// PyArrow's `to_pybytes()` serializes to Arrow IPC format, which can be
-/// efficiently deserialized in Rust without copying individual array elements.
+/// The schema is only borrowed. The array is moved out of its capsule, which is
+/// left holding a released struct as the PyCapsule protocol requires; the
+/// buffers stay owned by the producer until the Rust batch is dropped.
+fn record_batch_from_capsules(
+    schema_capsule: &PyCapsule,
+    array_capsule: &PyCapsule,
+) -> PyResult<RecordBatch> {
+    use arrow::array::StructArray;
+    use arrow::ffi::{from_ffi, FFI_ArrowArray, FFI_ArrowSchema};
+
+    check_capsule_name(schema_capsule, "arrow_schema")?;
+    check_capsule_name(array_capsule, "arrow_array")?;
+
+    // SAFETY: the capsule names were checked above, so the pointers refer to
+    // C Data Interface structs owned by the capsules
+    let data = unsafe {
+        let ffi_schema = &*(schema_capsule.pointer() as *const FFI_ArrowSchema);
+        let ffi_array = FFI_ArrowArray::from_raw(array_capsule.pointer() as *mut FFI_ArrowArray);
+        from_ffi(ffi_array, ffi_schema)
+    }
+    .map_err(|e| PyException::new_err(format!("Failed to import Arrow array: {}", e)))?;
+
+    if !matches!(data.data_type(), DataType::Struct(_)) {
+        return Err(PyTypeError::new_err(format!(
+            "Expected a RecordBatch (struct array), got Arrow type {}",
+            data.data_type()
+        )));
+    }
+    // A RecordBatch has no validity of its own, so null struct slots cannot be represented
+    if data.null_count() > 0 {
+        return Err(PyTypeError::new_err(
+            "Expected a RecordBatch (struct array), got a struct array with top-level nulls",
+        ));
+    }
+
+    Ok(RecordBatch::from(StructArray::from(data)))
+}
+
+/// Check that a PyCapsule carries the expected Arrow C Data Interface name
+fn check_capsule_name(capsule: &PyCapsule, expected: &str) -> PyResult<()> {
+    let name = capsule.name()?.and_then(|name| name.to_str().ok());
+    if name != Some(expected) {
+        return Err(PyTypeError::new_err(format!(
+            "Expected '{}' PyCapsule, got {:?}",
+            expected, name
+        )));
+    }
+    Ok(())
+}
+
+/// Convert PyArrow RecordBatch using the Arrow C Data Interface (zero-copy)
+///
+/// Used for PyArrow versions without the PyCapsule interface. PyArrow exports the batch as a struct array through `_export_to_c`, and the
+/// Rust arrays are built directly on top of the exported buffers. No column data
+/// is copied; the buffers stay owned by PyArrow and are released through the C
+/// interface release callback once the Rust batch is dropped.
 fn pyarrow_to_rust_batch_c_interface(_py: Python, batch_ref: &PyAny) -> PyResult<RecordBatch> {
-    use arrow::ipc::reader::StreamReader;
-    use std::io::Cursor;
-
-    // Use PyArrow's IPC serialization for efficient conversion
-    // This avoids copying individual array elements by using Arrow's
-    // binary format as an intermediate representation
-
-    // Serialize RecordBatch to IPC format using PyArrow
-    let serialized = batch_ref.call_method0("to_pybytes")?;
-    let bytes: Vec<u8> = serialized.extract()?;
-
-    // Deserialize in Rust using Arrow IPC reader
-    // This is efficient because Arrow IPC format matches Rust Arrow format
-    let cursor = Cursor::new(bytes);
-    let mut reader = StreamReader::try_new(cursor, None)
-        .map_err(|e| PyException::new_err(format!("Failed to create IPC reader: {}", e)))?;
-
-    // Read the RecordBatch from the IPC stream
-    let batch = reader
-        .next()
-        .ok_or_else(|| PyException::new_err("No RecordBatch in IPC stream"))?
-        .map_err(|e| PyException::new_err(format!("Failed to read RecordBatch: {}", e)))?;
-
-    Ok(batch)
+    use arrow::array::StructArray;
+    use arrow::ffi::{from_ffi, FFI_ArrowArray, FFI_ArrowSchema};
+    use std::ptr::addr_of_mut;
+
+    let mut ffi_array = FFI_ArrowArray::empty();
+    let mut ffi_schema = FFI_ArrowSchema::empty();
+
+    // PyArrow moves the batch into the empty structures we hand it
+    batch_ref.call_method1(
+        "_export_to_c",
+        (
+            addr_of_mut!(ffi_array) as usize,
+            addr_of_mut!(ffi_schema) as usize,
+        ),
+    )?;
+
+    // SAFETY: both structures were just populated by PyArrow's exporter, which
+    // follows the Arrow C Data Interface specification
+    let data = unsafe { from_ffi(ffi_array, &ffi_schema) }.map_err(|e| {
+        PyException::new_err(format!("Failed to import RecordBatch from PyArrow: {}", e))
+    })?;
+
+    Ok(RecordBatch::from(StructArray::from(data)))
 }
 
 /// Convert PyArrow RecordBatch using Python API (fallback method)
@@ -1175,42 +1609,51 @@ fn pyarrow_array_to_rust_array(
 
 /// Convert Rust RecordBatch to PyArrow RecordBatch
 ///
-/// Uses Arrow IPC serialization as an efficient intermediate format.
-/// Serializes the Rust RecordBatch to IPC format, then deserializes it in Python.
+/// Exports the batch through the Arrow C Data Interface and imports it with
+/// `pyarrow.RecordBatch._import_from_c`, so PyArrow takes ownership of the
+/// existing Arrow buffers without serializing or copying them.
 fn rust_batch_to_pyarrow(py: Python, batch: &RecordBatch) -> PyResult<PyObject> {
-    use arrow::ipc::writer::StreamWriter;
-    use pyo3::types::PyBytes;
-    use std::io::Cursor;
-
-    // Serialize Rust RecordBatch to IPC format
-    let mut buffer = Vec::new();
-    let cursor = Cursor::new(&mut buffer);
-    let mut writer = StreamWriter::try_new(cursor, &batch.schema())
-        .map_err(|e| PyException::new_err(format!("Failed to create IPC writer: {}", e)))?;
-
-    writer
-        .write(batch)
-        .map_err(|e| PyException::new_err(format!("Failed to write RecordBatch: {}", e)))?;
+    use arrow::array::StructArray;
+    use arrow::ffi::{FFI_ArrowArray, FFI_ArrowSchema};
 
-    writer
-        .finish()
-        .map_err(|e| PyException::new_err(format!("Failed to finish IPC writer: {}", e)))?;
+    let struct_array = StructArray::from(batch.clone());
+    let mut ffi_array = FFI_ArrowArray::new(&struct_array.to_data());
+    let mut ffi_schema = FFI_ArrowSchema::try_from(batch.schema().as_ref())
+        .map_err(|e| PyException::new_err(format!("Failed to export Arrow schema: {}", e)))?;
 
-    // Import PyArrow IPC module
+    // PyArrow moves the exported structures, leaving them released for Rust to drop
     let pyarrow = PyModule::import(py, "pyarrow")?;
-    let ipc_module = pyarrow.getattr("ipc")?;
-
-    // Create a BufferReader from the IPC bytes
-    let buffer_reader_class = pyarrow.getattr("BufferReader")?;
-    let ipc_bytes = PyBytes::new(py, &buffer);
-    let buffer_reader = buffer_reader_class.call1((ipc_bytes,))?;
+    let py_batch = pyarrow.getattr("RecordBatch")?.call_method1(
+        "_import_from_c",
+        (
+            std::ptr::addr_of_mut!(ffi_array) as usize,
+            std::ptr::addr_of_mut!(ffi_schema) as usize,
+        ),
+    )?;
+
+    Ok(py_batch.to_object(py))
+}
 
-    // Use open_stream to read the RecordBatch
-    let open_stream = ipc_module.getattr("open_stream")?;
-    let stream_reader = open_stream.call1((buffer_reader,))?;
+/// Convert a Rust Arrow array to a PyArrow Array
+///
+/// Uses the Arrow C Data Interface, so PyArrow takes over the Rust buffers
+/// without copying them.
+fn rust_array_to_pyarrow(py: Python, array: &dyn Array) -> PyResult<PyObject> {
+    use arrow::ffi::{FFI_ArrowArray, FFI_ArrowSchema};
 
-    // Read the first (and only) batch from the stream
-    let read_next = stream_reader.call_method0("read_next_batch")?;
+    let mut ffi_array = FFI_ArrowArray::new(&array.to_data());
+    let mut ffi_schema = FFI_ArrowSchema::try_from(array.data_type())
+        .map_err(|e| PyException::new_err(format!("Failed to export Arrow type: {}", e)))?;
 
-    Ok(read_next.to_object(py))
+    // PyArrow moves the exported structures, leaving them released for Rust to drop
+    let pyarrow = PyModule::import(py, "pyarrow")?;
+    let py_array = pyarrow.getattr("Array")?.call_method1(
+        "_import_from_c",
+        (
+            std::ptr::addr_of_mut!(ffi_array) as usize,
+            std::ptr::addr_of_mut!(ffi_schema) as usize,
+        ),
+    )?;
+
+    Ok(py_array.to_object(py))
 }
@@ -152,45 +152,58 @@ pub fn record_batch_to_protobuf_bytes(
         })
         .collect();
 
-    let mut successful_bytes = Vec::new();
+    // Resolve each column's field descriptor once per batch rather than once per row.
+    // Columns that are entirely null are dropped here: nulls are never encoded, so
+    // such a column contributes nothing to any row and its values need not be visited.
+    let mut columns = Vec::with_capacity(schema.fields().len());
+    for (field_idx, field) in schema.fields().iter().enumerate() {
+        if let Some(&field_desc) = field_by_name.get(field.name()) {
+            let array = batch.column(field_idx);
+            if array.null_count() < num_rows {
+                columns.push((
+                    field.name(),
+                    field_desc.number.unwrap_or(0),
+                    field_desc,
+                    array,
+                ));
+            }
+        } else {
+            debug!("Field '{}' not found in descriptor, skipping", field.name());
+        }
+    }
+
+    let mut successful_bytes = Vec::with_capacity(num_rows);
     let mut failed_rows = Vec::new();
 
+    // Rows of the same batch usually encode to similar sizes, so each row buffer
+    // starts at the size of the previous encoded row to avoid regrowth while encoding
+    let mut row_capacity = 0;
+
     // Convert each row directly from Arrow to Protobuf
     // Collect errors per-row instead of failing fast
     for row_idx in 0..num_rows {
-        let mut row_buffer = Vec::new();
+        let mut row_buffer = Vec::with_capacity(row_capacity);
         let mut row_failed = false;
         let mut row_error: Option<ZerobusError> = None;
 
         // Encode each field directly from Arrow array to Protobuf wire format
-        for (field_idx, field) in schema.fields().iter().enumerate() {
-            let array = batch.column(field_idx);
-
-            // Find field descriptor
-            if let Some(field_desc) = field_by_name.get(field.name()) {
-                let field_number = field_desc.number.unwrap_or(0);
-
-                if let Err(e) = encode_arrow_field_to_protobuf(
-                    &mut row_buffer,
-                    field_number,
-                    field_desc,
-                    array,
-                    row_idx,
-                    descriptor,
-                    Some(&nested_types_by_name),
-                ) {
-                    // Collect error for this row instead of returning immediately
-                    row_failed = true;
-                    row_error = Some(ZerobusError::ConversionError(format!(
-                        "Field encoding failed: field='{}', row={}, error={}",
-                        field.name(),
-                        row_idx,
-                        e
-                    )));
-                    break; // Stop processing this row
-                }
-            } else {
-                debug!("Field '{}' not found in descriptor, skipping", field.name());
+        for &(field_name, field_number, field_desc, array) in &columns {
+            if let Err(e) = encode_arrow_field_to_protobuf(
+                &mut row_buffer,
+                field_number,
+                field_desc,
+                array,
+                row_idx,
+                descriptor,
+                Some(&nested_types_by_name),
+            ) {
+                // Collect error for this row instead of returning immediately
+                row_failed = true;
+                row_error = Some(ZerobusError::ConversionError(format!(
+                    "Field encoding failed: field='{}', row={}, error={}",
+                    field_name, row_idx, e
+                )));
+                break; // Stop processing this row
             }
         }
 
@@ -213,6 +226,7 @@ pub fn record_batch_to_protobuf_bytes(
                 ));
             } else {
                 // Add to successful conversions
+                row_capacity = row_buffer.len();
                 successful_bytes.push((row_idx, row_buffer));
             }
         }
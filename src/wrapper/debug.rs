@@ -186,12 +186,15 @@ impl DebugWriter {
     }
 
     /// Ensure Arrow writer is initialized
+    ///
+    /// Takes the already-locked writer slot so callers can create the writer and
+    /// write to it under a single lock acquisition.
     async fn ensure_arrow_writer(
         &self,
+        writer_slot: &mut Option<arrow::ipc::writer::StreamWriter<BufWriter<std::fs::File>>>,
         schema: &arrow::datatypes::Schema,
     ) -> Result<(), ZerobusError> {
-        let mut writer_guard = self.arrow_writer.lock().await;
-        if writer_guard.is_none() {
+        if writer_slot.is_none() {
             let file_path_guard = self.arrow_file_path.lock().await;
             let file_path = file_path_guard.clone();
             drop(file_path_guard);
@@ -212,7 +215,7 @@ impl DebugWriter {
                     ))
                 })?;
 
-            *writer_guard = Some(writer);
+            *writer_slot = Some(writer);
             info!("✅ Created Arrow IPC stream file: {}", file_path.display());
         }
         Ok(())
@@ -483,11 +486,11 @@ impl DebugWriter {
         // Check if rotation is needed before writing
         let _rotated = self.rotate_arrow_file_if_needed(batch_rows).await?;
 
-        // Ensure writer is initialized (with correct schema)
-        self.ensure_arrow_writer(batch.schema().as_ref()).await?;
-
-        // Write batch
+        // Ensure writer is initialized (with correct schema) and write the batch
+        // under one lock; the open stream is reused until the next rotation
         let mut writer_guard = self.arrow_writer.lock().await;
+        self.ensure_arrow_writer(&mut writer_guard, batch.schema().as_ref())
+            .await?;
         if let Some(ref mut writer) = *writer_guard {
             writer.write(batch).map_err(|e| {
                 ZerobusError::ConfigurationError(format!(
@@ -818,10 +821,14 @@ impl DebugWriter {
     ///
     /// Returns error if flush fails.
     pub async fn flush(&self) -> Result<(), ZerobusError> {
-        // Flush Arrow writer (StreamWriter buffers internally)
-        // StreamWriter doesn't have explicit flush, but BufWriter will flush on drop
-        // For now, we just ensure the writer is still valid
-        let _arrow_guard = self.arrow_writer.lock().await;
+        // Flush Arrow writer so buffered IPC messages reach the file
+        let mut arrow_guard = self.arrow_writer.lock().await;
+        if let Some(ref mut writer) = *arrow_guard {
+            writer.flush().map_err(|e| {
+                ZerobusError::ConfigurationError(format!("Failed to flush Arrow file: {}", e))
+            })?;
+        }
+        drop(arrow_guard);
 
         // Flush Protobuf writer
         let mut proto_guard = self.protobuf_writer.lock().await;
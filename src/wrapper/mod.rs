@@ -14,8 +14,10 @@ use crate::config::WrapperConfiguration;
 use crate::error::ZerobusError;
 use crate::observability::ObservabilityManager;
 use crate::wrapper::retry::RetryConfig;
+use arrow::datatypes::SchemaRef;
 use arrow::record_batch::RecordBatch;
 use secrecy::ExposeSecret;
+use std::collections::HashMap;
 use std::sync::Arc;
 use tokio::sync::Mutex;
 use tracing::{debug, error, info, warn};
@@ -208,36 +210,7 @@ impl TransmissionResult {
     /// Returns `Some(RecordBatch)` containing only the failed rows, or `None` if there are no failed rows.
     /// Rows are extracted in the order they appear in `failed_rows`.
     pub fn extract_failed_batch(&self, original_batch: &RecordBatch) -> Option<RecordBatch> {
-        let failed_indices = self.get_failed_row_indices();
-        if failed_indices.is_empty() {
-            return None;
-        }
-
-        // Extract rows by index
-        let mut rows_to_extract = failed_indices;
-        rows_to_extract.sort(); // Ensure consistent ordering
-
-        // Use take to extract specific row indices
-        // Note: This requires Arrow's take kernel functionality
-        // For now, we'll use a simple approach: filter the batch
-        let mut arrays = Vec::new();
-        for array in original_batch.columns() {
-            // Use take to extract rows at specific indices
-            let taken = arrow::compute::take(
-                array,
-                &arrow::array::UInt32Array::from(
-                    rows_to_extract
-                        .iter()
-                        .map(|&idx| idx as u32)
-                        .collect::<Vec<_>>(),
-                ),
-                None,
-            )
-            .ok()?;
-            arrays.push(taken);
-        }
-
-        RecordBatch::try_new(original_batch.schema(), arrays).ok()
+        take_rows(original_batch, self.get_failed_row_indices())
     }
 
     /// Extract a RecordBatch containing only the successful rows from the original batch
@@ -251,34 +224,29 @@ impl TransmissionResult {
     /// Returns `Some(RecordBatch)` containing only the successful rows, or `None` if there are no successful rows.
     /// Rows are extracted in the order they appear in `successful_rows`.
     pub fn extract_successful_batch(&self, original_batch: &RecordBatch) -> Option<RecordBatch> {
-        let successful_indices = self.get_successful_row_indices();
-        if successful_indices.is_empty() {
-            return None;
-        }
-
-        // Extract rows by index
-        let mut rows_to_extract = successful_indices;
-        rows_to_extract.sort(); // Ensure consistent ordering
-
-        // Use take to extract specific row indices
-        let mut arrays = Vec::new();
-        for array in original_batch.columns() {
-            // Use take to extract rows at specific indices
-            let taken = arrow::compute::take(
-                array,
-                &arrow::array::UInt32Array::from(
-                    rows_to_extract
-                        .iter()
-                        .map(|&idx| idx as u32)
-                        .collect::<Vec<_>>(),
-                ),
-                None,
-            )
-            .ok()?;
-            arrays.push(taken);
-        }
+        take_rows(original_batch, self.get_successful_row_indices())
+    }
 
-        RecordBatch::try_new(original_batch.schema(), arrays).ok()
+    /// Split the original batch into its failed and successful rows
+    ///
+    /// Equivalent to calling `extract_failed_batch` and `extract_successful_batch`
+    /// on the same batch, for callers that need both partitions.
+    ///
+    /// # Arguments
+    ///
+    /// * `original_batch` - The original RecordBatch that was sent
+    ///
+    /// # Returns
+    ///
+    /// Returns `(failed, successful)`, each `None` if there are no rows in that partition.
+    pub fn split_batch(
+        &self,
+        original_batch: &RecordBatch,
+    ) -> (Option<RecordBatch>, Option<RecordBatch>) {
+        (
+            self.extract_failed_batch(original_batch),
+            self.extract_successful_batch(original_batch),
+        )
     }
 
     /// Get indices of failed rows filtered by error type
@@ -319,28 +287,23 @@ impl TransmissionResult {
     /// Returns a HashMap where keys are error type names (e.g., "ConversionError")
     /// and values are vectors of row indices that failed with that error type.
     pub fn group_errors_by_type(&self) -> std::collections::HashMap<String, Vec<usize>> {
-        let mut grouped: std::collections::HashMap<String, Vec<usize>> =
+        // Group on the static type name and only allocate one key per distinct type
+        let mut grouped: std::collections::HashMap<&'static str, Vec<usize>> =
             std::collections::HashMap::new();
 
         if let Some(failed_rows) = &self.failed_rows {
             for (row_idx, error) in failed_rows {
-                let error_type = match error {
-                    ZerobusError::ConfigurationError(_) => "ConfigurationError",
-                    ZerobusError::AuthenticationError(_) => "AuthenticationError",
-                    ZerobusError::ConnectionError(_) => "ConnectionError",
-                    ZerobusError::ConversionError(_) => "ConversionError",
-                    ZerobusError::TransmissionError(_) => "TransmissionError",
-                    ZerobusError::RetryExhausted(_) => "RetryExhausted",
-                    ZerobusError::TokenRefreshError(_) => "TokenRefreshError",
-                };
                 grouped
-                    .entry(error_type.to_string())
+                    .entry(error.error_type())
                     .or_default()
                     .push(*row_idx);
             }
         }
 
         grouped
+            .into_iter()
+            .map(|(error_type, indices)| (error_type.to_string(), indices))
+            .collect()
     }
 
     /// Get error statistics for this transmission result
@@ -362,24 +325,20 @@ impl TransmissionResult {
             0.0
         };
 
-        let mut error_type_counts: std::collections::HashMap<String, usize> =
+        let mut counts: std::collections::HashMap<&'static str, usize> =
             std::collections::HashMap::new();
 
         if let Some(failed_rows) = &self.failed_rows {
             for (_, error) in failed_rows {
-                let error_type = match error {
-                    ZerobusError::ConfigurationError(_) => "ConfigurationError",
-                    ZerobusError::AuthenticationError(_) => "AuthenticationError",
-                    ZerobusError::ConnectionError(_) => "ConnectionError",
-                    ZerobusError::ConversionError(_) => "ConversionError",
-                    ZerobusError::TransmissionError(_) => "TransmissionError",
-                    ZerobusError::RetryExhausted(_) => "RetryExhausted",
-                    ZerobusError::TokenRefreshError(_) => "TokenRefreshError",
-                };
-                *error_type_counts.entry(error_type.to_string()).or_insert(0) += 1;
+                *counts.entry(error.error_type()).or_insert(0) += 1;
             }
         }
 
+        let error_type_counts = counts
+            .into_iter()
+            .map(|(error_type, count)| (error_type.to_string(), count))
+            .collect();
+
         ErrorStatistics {
             total_rows: self.total_rows,
             successful_count: self.successful_count,
@@ -403,6 +362,35 @@ impl TransmissionResult {
     }
 }
 
+/// Extract the given row indices from a RecordBatch
+///
+/// Indices are sorted for consistent ordering. A contiguous run of indices is
+/// returned as a zero-copy slice of the original batch; otherwise a single index
+/// array is built once and shared by Arrow's `take` kernel across all columns.
+///
+/// Returns `None` if `indices` is empty or any index is out of bounds.
+fn take_rows(batch: &RecordBatch, mut indices: Vec<usize>) -> Option<RecordBatch> {
+    if indices.is_empty() {
+        return None;
+    }
+    indices.sort_unstable();
+
+    let first = indices[0];
+    let last = indices[indices.len() - 1];
+    if last >= batch.num_rows() {
+        return None;
+    }
+
+    // Sorted indices spanning exactly len() values with no duplicates are contiguous
+    if last - first + 1 == indices.len() && indices.windows(2).all(|w| w[0] != w[1]) {
+        return Some(batch.slice(first, indices.len()));
+    }
+
+    let take_indices =
+        arrow::array::UInt32Array::from_iter_values(indices.iter().map(|&idx| idx as u32));
+    arrow::compute::take_record_batch(batch, &take_indices).ok()
+}
+
 /// Error statistics for a transmission result
 #[derive(Debug, Clone)]
 pub struct ErrorStatistics {
@@ -439,8 +427,13 @@ pub struct ZerobusWrapper {
     debug_writer: Option<Arc<crate::wrapper::debug::DebugWriter>>,
     /// Track if we've written the descriptor for this table (once per table)
     descriptor_written: Arc<tokio::sync::Mutex<bool>>,
+    /// Auto-generated Protobuf descriptors, keyed by Arrow schema
+    descriptor_cache: Arc<std::sync::Mutex<DescriptorCache>>,
 }
 
+/// Validated Protobuf descriptors generated from Arrow schemas
+type DescriptorCache = HashMap<SchemaRef, Arc<prost_types::DescriptorProto>>;
+
 impl ZerobusWrapper {
     /// Validate and normalize the Zerobus endpoint URL.
     ///
@@ -636,6 +629,7 @@ impl ZerobusWrapper {
             observability,
             debug_writer,
             descriptor_written: Arc::new(tokio::sync::Mutex::new(false)),
+            descriptor_cache: Arc::new(std::sync::Mutex::new(HashMap::new())),
         })
     }
 
@@ -863,28 +857,9 @@ impl ZerobusWrapper {
             let descriptor_name = provided_descriptor.name.as_deref().unwrap_or("unknown");
             info!("🔍 [DEBUG] Using provided Protobuf descriptor: name='{}', fields={}, nested_types={}", 
                   descriptor_name, provided_descriptor.field.len(), provided_descriptor.nested_type.len());
-            provided_descriptor
+            Arc::new(provided_descriptor)
         } else {
-            debug!("Auto-generating Protobuf descriptor from Arrow schema");
-            let generated =
-                crate::wrapper::conversion::generate_protobuf_descriptor(batch.schema().as_ref())
-                    .map_err(|e| {
-                    ZerobusError::ConversionError(format!(
-                        "Failed to generate Protobuf descriptor: {}",
-                        e
-                    ))
-                })?;
-            // Validate generated descriptor (should always pass, but safety check)
-            crate::wrapper::conversion::validate_protobuf_descriptor(&generated).map_err(|e| {
-                ZerobusError::ConversionError(format!(
-                    "Generated Protobuf descriptor failed validation: {}",
-                    e
-                ))
-            })?;
-            let descriptor_name = generated.name.as_deref().unwrap_or("unknown");
-            info!("🔍 [DEBUG] Auto-generated Protobuf descriptor: name='{}', fields={}, nested_types={}", 
-                  descriptor_name, generated.field.len(), generated.nested_type.len());
-            generated
+            self.schema_descriptor(&batch.schema())?.0
         };
 
         // Write descriptor to file once per table (if either Arrow or Protobuf debug is enabled)
@@ -1058,7 +1033,7 @@ impl ZerobusWrapper {
                 let stream = crate::wrapper::zerobus::ensure_stream(
                     sdk,
                     self.config.table_name.clone(),
-                    descriptor.clone(),
+                    prost_types::DescriptorProto::clone(&descriptor),
                     client_id.clone(),
                     client_secret.clone(),
                 )
@@ -1186,7 +1161,7 @@ impl ZerobusWrapper {
                     let stream = crate::wrapper::zerobus::ensure_stream(
                         sdk,
                         self.config.table_name.clone(),
-                        descriptor.clone(),
+                        prost_types::DescriptorProto::clone(&descriptor),
                         client_id.clone(),
                         client_secret.clone(),
                     )
@@ -1531,6 +1506,76 @@ impl ZerobusWrapper {
         })
     }
 
+    /// Generate and cache the Protobuf descriptor for an Arrow schema
+    ///
+    /// `send_batch` builds the descriptor for a schema the first time it sees
+    /// it and reuses it for every later batch (and retry) with an equal schema.
+    /// Call this ahead of the first send to move that one-time cost out of the
+    /// hot path.
+    ///
+    /// # Arguments
+    ///
+    /// * `schema` - Arrow schema of the batches that will be sent
+    ///
+    /// # Returns
+    ///
+    /// Returns `true` if the descriptor was generated by this call, or `false`
+    /// if it was already cached.
+    ///
+    /// # Errors
+    ///
+    /// Returns `ConversionError` if no valid descriptor can be generated for the schema.
+    pub fn prime_schema(&self, schema: &SchemaRef) -> Result<bool, ZerobusError> {
+        self.schema_descriptor(schema)
+            .map(|(_, generated)| generated)
+    }
+
+    /// Look up the cached descriptor for a schema, generating it on a miss
+    ///
+    /// Returns the descriptor and whether it was generated by this call.
+    fn schema_descriptor(
+        &self,
+        schema: &SchemaRef,
+    ) -> Result<(Arc<prost_types::DescriptorProto>, bool), ZerobusError> {
+        if let Some(descriptor) = self.lock_descriptor_cache().get(schema) {
+            return Ok((Arc::clone(descriptor), false));
+        }
+
+        debug!("Auto-generating Protobuf descriptor from Arrow schema");
+        let generated = crate::wrapper::conversion::generate_protobuf_descriptor(schema.as_ref())
+            .map_err(|e| {
+            ZerobusError::ConversionError(format!("Failed to generate Protobuf descriptor: {}", e))
+        })?;
+        // Validate generated descriptor (should always pass, but safety check)
+        crate::wrapper::conversion::validate_protobuf_descriptor(&generated).map_err(|e| {
+            ZerobusError::ConversionError(format!(
+                "Generated Protobuf descriptor failed validation: {}",
+                e
+            ))
+        })?;
+        let descriptor_name = generated.name.as_deref().unwrap_or("unknown");
+        info!(
+            "🔍 [DEBUG] Auto-generated Protobuf descriptor: name='{}', fields={}, nested_types={}",
+            descriptor_name,
+            generated.field.len(),
+            generated.nested_type.len()
+        );
+
+        // Generation runs outside the lock; if another task raced us the
+        // descriptors are identical, so keeping either one is fine
+        let descriptor = Arc::new(generated);
+        self.lock_descriptor_cache()
+            .insert(Arc::clone(schema), Arc::clone(&descriptor));
+        Ok((descriptor, true))
+    }
+
+    fn lock_descriptor_cache(&self) -> std::sync::MutexGuard<'_, DescriptorCache> {
+        // The cache only holds immutable entries, so a poisoned lock is still usable
+        self.descriptor_cache
+            .lock()
+            .unwrap_or_else(|poisoned| poisoned.into_inner())
+    }
+
     /// Flush any pending operations and ensure data is transmitted
     ///
     /// # Errors
@@ -1599,6 +1644,7 @@ impl Clone for ZerobusWrapper {
             observability: self.observability.clone(),
             debug_writer: self.debug_writer.as_ref().map(Arc::clone),
             descriptor_written: Arc::clone(&self.descriptor_written),
+            descriptor_cache: Arc::clone(&self.descriptor_cache),
         }
     }
 }
@@ -1611,4 +1657,5 @@ impl Clone for ZerobusWrapper {
 // - Option<ObservabilityManager>: Send + Sync (ObservabilityManager is Send + Sync)
 // - Option<Arc<DebugWriter>>: Send + Sync
 // - Arc<Mutex<bool>>: Send + Sync
+// - Arc<std::sync::Mutex<DescriptorCache>>: Send + Sync
 // The compiler automatically derives Send + Sync for this struct, so explicit unsafe impl is not needed.
@@ -11,10 +11,20 @@ hanging after tests complete.
 Workarounds implemented:
 1. Set PYO3_NO_PYTHON_VERSION_CHECK to skip version checks
 2. Use session-level fixture to initialize Python once
-3. Force garbage collection after each test
-4. Use pytest-forked for process isolation (configured in pytest.ini)
+3. Collect garbage after a test only when it left enough tracked allocations
+   behind to warrant a full collection
+4. Run only tests marked @pytest.mark.forked in a subprocess (pytest-forked);
+   forking every test costs a process start per test
+5. Shard the suite across cores with pytest-xdist (pytest -n auto); tests
+   that write files use tmp_path-based directories (debug_dir fixture)
+6. Disable automatic (cyclic) GC for the session so a generation-2 pass
+   cannot pause an async test or a benchmark mid-measurement; collection
+   happens only at test teardown (see 3). Tests that allocate large PyArrow
+   arrays should call gc.collect() in their own teardown so memory does not
+   accumulate across the tests an xdist worker runs
 """
 
+import asyncio
 import pytest
 import os
 import gc
@@ -28,11 +38,24 @@ os.environ.setdefault("PYO3_NO_PYTHON_VERSION_CHECK", "1")
 # Note: We don't actually use the import here, but importing it early
 # helps catch import errors before tests run
 try:
-    import arrow_zerobus_sdk_wrapper  # noqa: F401
+    import arrow_zerobus_sdk_wrapper
 except ImportError:
+    arrow_zerobus_sdk_wrapper = None
     # If module is not available, skip all tests
     pytestmark = pytest.mark.skip("arrow_zerobus_sdk_wrapper not available")
 
+# Pending allocations (summed across GC generations) above which a test's
+# teardown triggers a collection; below it, refcounting has already freed
+# everything that matters and a full-heap walk would be wasted work
+GC_COLLECT_THRESHOLD = 700
+
+# uvloop's event loop switches tasks several times faster than the default
+# selector loop; it is optional and not available on Windows or PyPy
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 
 @pytest.fixture(scope="session", autouse=True)
 def setup_python_environment():
@@ -45,17 +68,12 @@ def setup_python_environment():
     is only initialized once per test session.
     """
     # Pre-initialize Python to avoid multiple initializations
-    # This helps prevent the PyO3 pytest hang issue
-    try:
-        import arrow_zerobus_sdk_wrapper  # noqa: F401
-
-        # Force module import to initialize Python bindings early
-        # This ensures Python is initialized before tests run
-        _ = arrow_zerobus_sdk_wrapper.ZerobusWrapper  # noqa: F401
-    except (ImportError, AttributeError):
-        # Module not available or doesn't have expected attributes
-        # This is expected in some test environments, so we silently continue
-        pass
+    # This helps prevent the PyO3 pytest hang issue. The module was already
+    # imported above, so only touch the bindings rather than importing again
+    if arrow_zerobus_sdk_wrapper is not None:
+        # Force the Python bindings to initialize before tests run
+        # Module may lack expected attributes in some test environments
+        getattr(arrow_zerobus_sdk_wrapper, "ZerobusWrapper", None)
 
     yield
 
@@ -65,6 +83,29 @@ def setup_python_environment():
     gc.collect()
 
 
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run asyncio tests on uvloop when it is installed (pytest-asyncio hook)."""
+    if uvloop is not None:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _no_gc():
+    """Disable automatic garbage collection for the whole session.
+
+    Starts from a clean heap and restores the previous GC state afterwards.
+    Explicit gc.collect() calls (isolate_tests, test teardowns) still run.
+    """
+    gc.collect()
+    was_enabled = gc.isenabled()
+    gc.disable()
+    yield
+    if was_enabled:
+        gc.enable()
+
+
 @pytest.fixture(autouse=True)
 def isolate_tests():
     """Fixture to isolate each test and prevent shared state issues.
@@ -74,25 +115,128 @@ def isolate_tests():
     """
     # Setup: ensure clean state
     yield
-    # Teardown: force garbage collection after each test
-    # This releases Python objects and prevents GIL issues
-    gc.collect()
-    # Run multiple times to ensure all cyclic references are cleared
-    gc.collect()
+    # Teardown: collect only when the test left cyclic garbage candidates
+    # behind; most tests release everything through refcounting alone
+    if sum(gc.get_count()) > GC_COLLECT_THRESHOLD:
+        gc.collect()
+
+
+@pytest.fixture
+def debug_dir(tmp_path):
+    """Per-test debug output directory for writer-disabled wrappers.
+
+    Lives under tmp_path, so it is unique per test and per xdist worker and
+    pytest removes it without any try/finally in the test.
+    """
+    path = tmp_path / "debug"
+    path.mkdir()
+    return str(path)
+
+
+@pytest.fixture
+def disabled_wrapper(debug_dir):
+    """Per-test writer-disabled ZerobusWrapper, shut down at teardown.
+
+    Creating a wrapper starts the shared Tokio runtime, so tests using this
+    fixture must be marked @pytest.mark.forked. pytest-forked sets up every
+    fixture inside the test's own child process, so a session- or
+    module-scoped wrapper could not be shared between forked tests anyway;
+    it would be rebuilt in each child. Building it per test keeps that cost
+    explicit and keeps runtime threads out of the main pytest process.
+    Tests must not shut it down.
+    """
+    if arrow_zerobus_sdk_wrapper is None:
+        pytest.skip("arrow_zerobus_sdk_wrapper not available")
+    config = arrow_zerobus_sdk_wrapper.WrapperConfiguration(
+        endpoint="https://test.cloud.databricks.com",
+        table_name="test_table",
+        debug_enabled=True,
+        debug_output_dir=debug_dir,
+        zerobus_writer_disabled=True,
+    )
+    wrapper = arrow_zerobus_sdk_wrapper.ZerobusWrapper(config)
+    yield wrapper
+    wrapper.shutdown()
+
+
+@pytest.fixture(scope="session")
+def id_name_schema():
+    """Session-wide (id: int64, name: string) schema shared by batch-building tests.
+
+    A fixture rather than a conftest constant: importing a constant from
+    conftest would load pyarrow into every test module, including the ones
+    that never build a batch.
+    """
+    pa = pytest.importorskip("pyarrow")
+    return pa.schema(
+        [
+            pa.field("id", pa.int64()),
+            pa.field("name", pa.string()),
+        ]
+    )
+
+
+@pytest.fixture(scope="session")
+def id_name_score_schema(id_name_schema):
+    """Session-wide id_name_schema with an extra (score: float64) column."""
+    pa = pytest.importorskip("pyarrow")
+    return id_name_schema.append(pa.field("score", pa.float64()))
+
+
+@pytest.fixture(scope="session")
+def id_name_batch(id_name_schema):
+    """Session-wide (id: int64, name: string) RecordBatch with three rows.
+
+    RecordBatches are immutable, so one instance is safely shared by every
+    test instead of rebuilding the same Arrow arrays per test.
+    """
+    pa = pytest.importorskip("pyarrow")
+    np = pytest.importorskip("numpy")
+
+    # NumPy-backed columns: PyArrow wraps the contiguous int64 buffer instead
+    # of converting each Python int
+    arrays = [
+        pa.array(np.array([1, 2, 3], dtype=np.int64)),
+        pa.array(
+            np.array(["Alice", "Bob", "Charlie"], dtype=object), type=pa.string()
+        ),
+    ]
+    return pa.RecordBatch.from_arrays(arrays, schema=id_name_schema)
+
+
+@pytest.fixture(scope="session")
+def id_name_score_batch(id_name_batch, id_name_score_schema):
+    """Session-wide id_name_batch with an extra (score: float64) column."""
+    pa = pytest.importorskip("pyarrow")
+    np = pytest.importorskip("numpy")
+
+    return pa.RecordBatch.from_arrays(
+        [*id_name_batch.columns, pa.array(np.array([95.5, 87.0, 92.5]))],
+        schema=id_name_score_schema,
+    )
 
 
-# Configure pytest to use forked/isolated test execution if available
-# This prevents GIL and initialization issues
 def pytest_configure(config):
     """Configure pytest with PyO3-specific settings."""
     # Add custom markers
     config.addinivalue_line(
         "markers", "python: marks tests that require Python bindings"
     )
+    # Registered here as well so the marker is known without pytest-forked;
+    # when the plugin is installed it runs marked tests in a subprocess
+    config.addinivalue_line(
+        "markers", "forked: run this test in a forked subprocess"
+    )
+
 
-    # If pytest-xdist is available, configure it for better isolation
-    if hasattr(config.option, "numprocesses"):
-        # Use process-based isolation for PyO3 tests
-        if config.option.numprocesses is None:
-            # Default to 1 process to avoid GIL issues
-            config.option.numprocesses = 1
+def pytest_ignore_collect(collection_path, config):
+    """Collect the send_batch benchmarks only for --benchmark-only runs.
+
+    The benchmarks are not forked, so collecting them in the regular suite
+    would start a Tokio runtime in the main pytest process.
+    """
+    if collection_path.name == "test_benchmark_send_batch.py":
+        # The option only exists when pytest-benchmark is installed
+        if not config.getoption("benchmark_only", default=False):
+            return True
+    return None
@@ -0,0 +1,121 @@
+"""Microbenchmarks for the send_batch hot path
+
+Measure per-call binding overhead and conversion throughput with the Zerobus
+writer disabled, so the numbers reflect the Python/Rust crossing and the
+Arrow-to-Protobuf conversion rather than network latency.
+
+These tests are not marked forked: pytest-benchmark records timings in the
+process that collected the tests, and a forked child's results would be lost.
+They therefore start a Tokio runtime in the pytest process, so conftest.py
+only collects this file when --benchmark-only is given and the regular suite
+never sees it.
+
+Run with: pytest tests/python/test_benchmark_send_batch.py --benchmark-only
+(CI adds --assert=plain, since these tests only assert result.success)
+"""
+
+import numpy as np
+import pytest
+import pyarrow as pa
+
+pytest.importorskip("pytest_benchmark")
+
+try:
+    import arrow_zerobus_sdk_wrapper
+except ImportError:
+    pytestmark = pytest.mark.skip("arrow_zerobus_sdk_wrapper not available")
+
+LARGE_BATCH_ROWS = 1_000_000
+
+
+@pytest.fixture(scope="module")
+def disabled_wrapper(tmp_path_factory):
+    """Module-wide writer-disabled wrapper, overriding the per-test conftest one.
+
+    The benchmarks run in-process rather than forked, so one wrapper really
+    can be shared: it is built once for the module instead of once per
+    benchmark, and shut down after the last one.
+    """
+    config = arrow_zerobus_sdk_wrapper.WrapperConfiguration(
+        endpoint="https://test.cloud.databricks.com",
+        table_name="test_table",
+        debug_enabled=True,
+        debug_output_dir=str(tmp_path_factory.mktemp("debug")),
+        zerobus_writer_disabled=True,
+    )
+    wrapper = arrow_zerobus_sdk_wrapper.ZerobusWrapper(config)
+    yield wrapper
+    wrapper.shutdown()
+
+
+@pytest.fixture(scope="module")
+def large_batch():
+    """Single int64 column RecordBatch with LARGE_BATCH_ROWS rows."""
+    return pa.RecordBatch.from_arrays(
+        [pa.array(np.arange(LARGE_BATCH_ROWS, dtype=np.int64))], names=["id"]
+    )
+
+
+@pytest.fixture(scope="module")
+def id_name_ipc_bytes(id_name_batch):
+    """id_name_batch serialized once as an Arrow IPC stream."""
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, id_name_batch.schema) as writer:
+        writer.write_batch(id_name_batch)
+    return sink.getvalue().to_pybytes()
+
+
+def test_small_batch_overhead(benchmark, disabled_wrapper, id_name_batch):
+    """Per-call overhead of send_batch on a three-row batch."""
+    benchmark.group = "send_batch overhead"
+    result = benchmark(disabled_wrapper.send_batch, id_name_batch)
+    assert result.success
+
+
+def test_large_batch_throughput(benchmark, disabled_wrapper, large_batch):
+    """Conversion throughput of send_batch on a one-million-row batch."""
+    benchmark.group = "send_batch throughput"
+    benchmark.extra_info["rows"] = large_batch.num_rows
+    benchmark.extra_info["bytes"] = large_batch.nbytes
+    result = benchmark.pedantic(
+        disabled_wrapper.send_batch, args=(large_batch,), rounds=5, iterations=1
+    )
+    assert result.success
+    # pytest-benchmark reports ops/s; derive MB/s from the mean round time
+    if benchmark.stats is not None:
+        mb_per_s = large_batch.nbytes / benchmark.stats.stats.mean / 1e6
+        benchmark.extra_info["mb_per_s"] = round(mb_per_s, 1)
+
+
+@pytest.mark.parametrize(
+    "entry_point",
+    ["send_batch", "_send_batch_raw", "send_batches", "send_serialized"],
+)
+def test_entry_point_overhead(
+    benchmark, disabled_wrapper, id_name_batch, id_name_ipc_bytes, entry_point
+):
+    """Compare the binding entry points on the same three-row batch.
+
+    send_batch dispatches on the object's type, _send_batch_raw takes the Arrow
+    PyCapsules directly, and send_batches amortizes one runtime entry over a
+    list (of one here) and send_serialized decodes pre-built Arrow IPC bytes,
+    separating serialization cost from send cost. Keeping them side by side
+    justifies future binding changes with data.
+    """
+    benchmark.group = "entry point overhead"
+    if entry_point == "_send_batch_raw":
+        if not hasattr(id_name_batch, "__arrow_c_array__"):
+            pytest.skip("PyArrow without the Arrow PyCapsule interface")
+        # Capsules are consumed by the import, so export fresh ones per call
+        result = benchmark(
+            lambda: disabled_wrapper._send_batch_raw(
+                *id_name_batch.__arrow_c_array__()
+            )
+        )
+    elif entry_point == "send_batches":
+        result = benchmark(disabled_wrapper.send_batches, [id_name_batch])[0]
+    elif entry_point == "send_serialized":
+        result = benchmark(disabled_wrapper.send_serialized, id_name_ipc_bytes)[0]
+    else:
+        result = benchmark(disabled_wrapper.send_batch, id_name_batch)
+    assert result.success
@@ -148,6 +148,76 @@ def test_get_error_messages_empty():
     assert len(error_messages) == 0
 
 
+def test_errors_by_type_columnar():
+    """Test errors_by_type_columnar() matches group_errors_by_type()."""
+    result = TransmissionResult(
+        success=True,
+        failed_rows=[
+            (0, "TransmissionError: error 1"),
+            (1, "ConversionError: error 2"),
+            (4, "ConversionError: error 3"),
+        ],
+        successful_rows=[2, 3],
+        total_rows=5,
+        successful_count=2,
+        failed_count=3,
+    )
+
+    types, indices, offsets = result.errors_by_type_columnar()
+
+    assert types == ["ConversionError", "TransmissionError"]
+    assert str(indices.type) == "int64" and str(offsets.type) == "int64"
+    assert indices.to_pylist() == [1, 4, 0]
+    assert offsets.to_pylist() == [0, 2, 3]
+
+    grouped = result.group_errors_by_type()
+    for i, error_type in enumerate(types):
+        start, end = offsets[i].as_py(), offsets[i + 1].as_py()
+        assert indices[start:end].to_pylist() == grouped[error_type]
+
+
+def test_errors_by_type_columnar_empty():
+    """Test errors_by_type_columnar() with no failed rows."""
+    result = TransmissionResult(
+        success=True,
+        failed_rows=None,
+        successful_rows=[0, 1, 2],
+        total_rows=3,
+        successful_count=3,
+        failed_count=0,
+    )
+
+    types, indices, offsets = result.errors_by_type_columnar()
+    assert types == []
+    assert len(indices) == 0
+    assert offsets.to_pylist() == [0]
+
+
+def test_analyze():
+    """Test analyze() matches the individual analysis methods."""
+    result = TransmissionResult(
+        success=True,
+        failed_rows=[
+            (0, "ConversionError: error 1"),
+            (2, "TransmissionError: error 2"),
+            (3, "ConversionError: error 3"),
+        ],
+        successful_rows=[1, 4],
+        total_rows=5,
+        successful_count=2,
+        failed_count=3,
+    )
+
+    info = result.analyze()
+
+    assert info.partial == result.is_partial_success()
+    assert info.failed_indices == result.get_failed_row_indices()
+    assert info.statistics == result.get_error_statistics()
+    assert info.grouped_errors == result.group_errors_by_type()
+    assert info.messages == result.get_error_messages()
+    assert info.grouped_errors["ConversionError"] == [0, 3]
+
+
 def test_error_pattern_analysis():
     """Test error pattern analysis across multiple results."""
     results = [
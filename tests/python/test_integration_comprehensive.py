@@ -4,6 +4,10 @@ These tests verify Python API functionality including async operations,
 error translation, and RecordBatch conversion.
 """
 
+import os
+import sys
+
+import numpy as np
 import pytest
 import pyarrow as pa
 import asyncio
@@ -15,6 +19,7 @@ try:
         ZerobusWrapper,
         WrapperConfiguration,
         TransmissionResult,
+        ZerobusError,
         ConfigurationError,
         AuthenticationError,
         ConnectionError,
@@ -26,6 +31,18 @@ try:
 except ImportError:
     pytestmark = pytest.mark.skip("arrow_zerobus_sdk_wrapper not available")
 
+# One column per primitive type covered by test_record_batch_various_types
+VARIOUS_TYPES_SCHEMA = pa.schema(
+    [
+        pa.field("int32", pa.int32()),
+        pa.field("int64", pa.int64()),
+        pa.field("float32", pa.float32()),
+        pa.field("float64", pa.float64()),
+        pa.field("string", pa.string()),
+        pa.field("bool", pa.bool_()),
+    ]
+)
+
 
 def test_error_translation():
     """Test that Rust errors are properly translated to Python exceptions."""
@@ -38,6 +55,18 @@ def test_error_translation():
     assert issubclass(RetryExhausted, Exception)
     assert issubclass(TokenRefreshError, Exception)
 
+    # All errors share the ZerobusError base, so one except clause catches them
+    for error_class in (
+        ConfigurationError,
+        AuthenticationError,
+        ConnectionError,
+        ConversionError,
+        TransmissionError,
+        RetryExhausted,
+        TokenRefreshError,
+    ):
+        assert issubclass(error_class, ZerobusError)
+
     # Test that error instances can be created
     config_error = ConfigurationError("test config error")
     assert isinstance(config_error, Exception)
@@ -66,6 +95,7 @@ def test_error_translation_all_types():
         assert str(error) == message
 
 
+@pytest.mark.forked
 @pytest.mark.asyncio
 async def test_async_context_manager():
     """Test async context manager (if implemented)."""
@@ -95,8 +125,9 @@ async def test_async_context_manager():
         assert isinstance(e, (ConfigurationError, ConnectionError, ImportError))
 
 
+@pytest.mark.forked
 @pytest.mark.asyncio
-async def test_concurrent_python_operations():
+async def test_concurrent_python_operations(id_name_batch, disabled_wrapper):
     """Test concurrent operations from Python."""
     # Test that multiple async operations can run concurrently
     # This verifies thread safety from Python side
@@ -113,63 +144,38 @@ async def test_concurrent_python_operations():
         except Exception:
             return None
 
-    # Create multiple wrappers concurrently
-    tasks = [create_wrapper() for _ in range(5)]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    # Create multiple wrappers concurrently; the helper turns construction
+    # failures into None, so the task group only fails on a real bug
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(create_wrapper()) for _ in range(5)]
+    results = [task.result() for task in tasks]
 
     # All should complete (may fail, but shouldn't deadlock)
     assert len(results) == 5
 
-    # Verify no exceptions were raised (or all are expected exceptions)
-    for result in results:
-        if isinstance(result, Exception):
-            assert isinstance(
-                result, (ConfigurationError, ConnectionError, ImportError)
+    # send_batch releases the GIL while the Tokio runtime drives the send, so
+    # sends dispatched to worker threads overlap instead of serializing
+    async with asyncio.TaskGroup() as tg:
+        sends = [
+            tg.create_task(
+                asyncio.to_thread(disabled_wrapper.send_batch, id_name_batch)
             )
+            for _ in range(5)
+        ]
+    send_results = [send.result() for send in sends]
 
+    assert all(result.success for result in send_results)
 
-def test_record_batch_conversion():
+
+def test_record_batch_conversion(id_name_score_batch, id_name_score_schema):
     """Test PyArrow RecordBatch conversion."""
     # Test zero-copy conversion from PyArrow to Rust
-
-    # Create a simple RecordBatch
-    schema = pa.schema(
-        [
-            pa.field("id", pa.int64()),
-            pa.field("name", pa.string()),
-            pa.field("score", pa.float64()),
-        ]
-    )
-
-    arrays = [
-        pa.array([1, 2, 3], type=pa.int64()),
-        pa.array(["Alice", "Bob", "Charlie"], type=pa.string()),
-        pa.array([95.5, 87.0, 92.5], type=pa.float64()),
-    ]
-
-    batch = pa.RecordBatch.from_arrays(arrays, schema=schema)
+    batch = id_name_score_batch
 
     # Verify batch structure
     assert batch.num_rows == 3
     assert batch.num_columns == 3
-    assert len(batch.schema) == 3
-
-    # Test that batch can be passed to wrapper (if available)
-    # This is a structural test - actual conversion happens in send_batch
-    try:
-        config = WrapperConfiguration(
-            endpoint="https://test.cloud.databricks.com",
-            table_name="test_table",
-        )
-        wrapper = ZerobusWrapper(config)
-
-        # The batch should be convertible (actual conversion tested in send_batch)
-        assert batch is not None
-        assert wrapper is not None
-
-    except Exception:
-        # Expected if credentials required
-        pass
+    assert batch.schema.equals(id_name_score_schema)
 
 
 def test_record_batch_various_types():
@@ -177,54 +183,100 @@ def test_record_batch_various_types():
     # Test that different Arrow types can be converted
 
     # Test with different data types
-    schema = pa.schema(
-        [
-            pa.field("int32", pa.int32()),
-            pa.field("int64", pa.int64()),
-            pa.field("float32", pa.float32()),
-            pa.field("float64", pa.float64()),
-            pa.field("string", pa.string()),
-            pa.field("bool", pa.bool_()),
-        ]
-    )
-
+    # Numeric columns wrap NumPy buffers rather than boxing Python numbers
     arrays = [
-        pa.array([1, 2, 3], type=pa.int32()),
-        pa.array([10, 20, 30], type=pa.int64()),
-        pa.array([1.5, 2.5, 3.5], type=pa.float32()),
-        pa.array([10.5, 20.5, 30.5], type=pa.float64()),
+        pa.array(np.array([1, 2, 3], dtype=np.int32)),
+        pa.array(np.array([10, 20, 30], dtype=np.int64)),
+        pa.array(np.array([1.5, 2.5, 3.5], dtype=np.float32)),
+        pa.array(np.array([10.5, 20.5, 30.5], dtype=np.float64)),
         pa.array(["a", "b", "c"], type=pa.string()),
         pa.array([True, False, True], type=pa.bool_()),
     ]
 
-    batch = pa.RecordBatch.from_arrays(arrays, schema=schema)
+    batch = pa.RecordBatch.from_arrays(arrays, schema=VARIOUS_TYPES_SCHEMA)
 
     assert batch.num_rows == 3
     assert batch.num_columns == 6
 
 
-def test_record_batch_with_nulls():
+def test_record_batch_with_nulls(id_name_schema):
     """Test RecordBatch with null values."""
     # Test that null values are handled correctly
 
-    schema = pa.schema(
-        [
-            pa.field("id", pa.int64()),
-            pa.field("name", pa.string()),
-        ]
-    )
-
     arrays = [
         pa.array([1, None, 3], type=pa.int64()),
         pa.array(["Alice", "Bob", None], type=pa.string()),
     ]
 
-    batch = pa.RecordBatch.from_arrays(arrays, schema=schema)
+    batch = pa.RecordBatch.from_arrays(arrays, schema=id_name_schema)
 
     assert batch.num_rows == 3
     assert batch.num_columns == 2
 
 
+@pytest.mark.forked
+def test_record_batch_all_null_column(disabled_wrapper, id_name_schema):
+    """Test sending a batch whose name column is entirely null."""
+    arrays = [
+        pa.array([1, 2, 3], type=pa.int64()),
+        pa.array([None, None, None], type=pa.string()),
+    ]
+    batch = pa.RecordBatch.from_arrays(arrays, schema=id_name_schema)
+    assert batch.column(1).null_count == batch.num_rows
+
+    # The all-null column is skipped during conversion; every row still encodes
+    result = disabled_wrapper.send_batch(batch)
+    assert result.success
+    assert result.successful_count == 3
+    assert result.failed_count == 0
+
+
+@pytest.mark.forked
+def test_record_batch_no_nulls(disabled_wrapper, id_name_batch):
+    """Test sending a batch whose columns carry no validity bitmap at all."""
+    assert all(column.buffers()[0] is None for column in id_name_batch.columns)
+
+    result = disabled_wrapper.send_batch(id_name_batch)
+    assert result.success
+    assert result.successful_count == 3
+    assert result.failed_count == 0
+
+
+@pytest.mark.forked
+def test_send_serialized(disabled_wrapper, id_name_batch):
+    """Test sending a batch pre-serialized as an Arrow IPC stream."""
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, id_name_batch.schema) as writer:
+        writer.write_batch(id_name_batch)
+    ipc_bytes = sink.getvalue().to_pybytes()
+
+    results = disabled_wrapper.send_serialized(ipc_bytes)
+    assert len(results) == 1
+    assert results[0].success
+    assert results[0].successful_count == id_name_batch.num_rows
+
+    with pytest.raises(ConversionError, match="Failed to read Arrow IPC stream"):
+        disabled_wrapper.send_serialized(b"not an arrow stream")
+
+
+@pytest.mark.forked
+def test_schema_cache_hit(disabled_wrapper):
+    """Test that the descriptor for a schema is built once and then reused."""
+    schema = pa.schema([("cache_probe", pa.int64())])
+    batch = pa.RecordBatch.from_arrays(
+        [pa.array([1, 2], type=pa.int64())], schema=schema
+    )
+
+    # The first send builds the descriptor, so priming afterwards is a cache hit
+    assert disabled_wrapper.send_batch(batch).success
+    assert disabled_wrapper.prime_schema(schema) is False
+    assert disabled_wrapper.send_batch(batch).success
+
+    other = pa.schema([("cache_probe_other", pa.int64())])
+    assert disabled_wrapper.prime_schema(other) is True
+    assert disabled_wrapper.prime_schema(other) is False
+
+
 def test_wrapper_configuration_methods():
     """Test WrapperConfiguration builder methods."""
     # Test that configuration can be built using builder pattern
@@ -267,6 +319,7 @@ def test_transmission_result_structure():
     # - batch_size_bytes: int
 
 
+@pytest.mark.forked
 def test_wrapper_initialization_with_options():
     """Test wrapper initialization with various options."""
     # Test that wrapper can be initialized with different configurations
@@ -297,95 +350,85 @@ def test_wrapper_initialization_with_options():
         pass  # Expected without real credentials
 
 
-def test_error_hierarchy():
-    """Test that error classes form a proper hierarchy."""
-    # Verify error classes are properly structured
-
-    # All should be exceptions
-    assert issubclass(ConfigurationError, Exception)
-    assert issubclass(AuthenticationError, Exception)
-    assert issubclass(ConnectionError, Exception)
-    assert issubclass(ConversionError, Exception)
-    assert issubclass(TransmissionError, Exception)
-    assert issubclass(RetryExhausted, Exception)
-    assert issubclass(TokenRefreshError, Exception)
-
-    # All should be subclasses of ZerobusError (if it's a base class)
-    # Note: In PyO3, all exceptions extend PyException directly
-    # but they're logically grouped as ZerobusError exceptions
-
+def _thread_count():
+    """Number of OS threads in this process, read from /proc/self/status."""
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("Threads:"):
+                return int(line.split()[1])
+    raise AssertionError("Threads: entry missing from /proc/self/status")
 
-def test_configuration_validation_from_python():
-    """Test configuration validation from Python."""
-    # Test that validation works from Python
 
-    # Valid configuration
-    valid_config = WrapperConfiguration(
+@pytest.mark.forked
+@pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="reads /proc/self/status"
+)
+def test_single_runtime(debug_dir):
+    """All wrappers share one Tokio runtime instead of one thread pool each."""
+    config = WrapperConfiguration(
         endpoint="https://test.cloud.databricks.com",
         table_name="test_table",
+        debug_enabled=True,
+        debug_output_dir=debug_dir,
+        zerobus_writer_disabled=True,
     )
+    # The first wrapper starts the shared runtime and its worker threads
+    wrappers = [ZerobusWrapper(config)]
+    threads_after_first = _thread_count()
+    wrappers.extend(ZerobusWrapper(config) for _ in range(99))
 
-    try:
-        valid_config.validate()
-        # Should not raise
-    except Exception as e:
-        # May raise if validation is strict
-        assert isinstance(e, ConfigurationError)
+    # Per-wrapper runtimes would add at least one thread per wrapper
+    assert _thread_count() <= threads_after_first
 
-    # Invalid configuration
-    invalid_config = WrapperConfiguration(
-        endpoint="invalid-endpoint",
+    for wrapper in wrappers:
+        wrapper.shutdown()
+
+
+@pytest.mark.forked
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_runtime_after_fork(id_name_batch, debug_dir):
+    """A forked child gets its own runtime; pre-fork wrappers refuse to run."""
+    config = WrapperConfiguration(
+        endpoint="https://test.cloud.databricks.com",
         table_name="test_table",
+        debug_enabled=True,
+        debug_output_dir=debug_dir,
+        zerobus_writer_disabled=True,
     )
+    parent_wrapper = ZerobusWrapper(config)
 
-    try:
-        invalid_config.validate()
-        # May or may not raise depending on implementation
-    except Exception as e:
-        assert isinstance(e, ConfigurationError)
+    pid = os.fork()
+    if pid == 0:
+        # Child: report through the exit status, never return into pytest
+        status = 1
+        try:
+            try:
+                parent_wrapper.send_batch(id_name_batch)
+            except RuntimeError:
+                child_wrapper = ZerobusWrapper(config)
+                if child_wrapper.send_batch(id_name_batch).success:
+                    status = 0
+                child_wrapper.shutdown()
+        finally:
+            os._exit(status)
 
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
 
-@pytest.mark.asyncio
-async def test_async_send_batch():
-    """Test async send_batch operation."""
-    # Test that send_batch can be called asynchronously
+    # The parent's runtime is untouched by the child
+    assert parent_wrapper.send_batch(id_name_batch).success
+    parent_wrapper.shutdown()
 
-    try:
-        config = WrapperConfiguration(
-            endpoint="https://test.cloud.databricks.com",
-            table_name="test_table",
-        )
-        wrapper = ZerobusWrapper(config)
 
-        # Create test batch
-        schema = pa.schema(
-            [
-                pa.field("id", pa.int64()),
-                pa.field("name", pa.string()),
-            ]
-        )
-        arrays = [
-            pa.array([1, 2, 3], type=pa.int64()),
-            pa.array(["Alice", "Bob", "Charlie"], type=pa.string()),
-        ]
-        batch = pa.RecordBatch.from_arrays(arrays, schema=schema)
-
-        # Try to send (will fail without credentials, but tests async pattern)
-        try:
-            result = await wrapper.send_batch(batch)
-            # If successful, verify result structure
-            assert hasattr(result, "success")
-            assert hasattr(result, "attempts")
-            assert hasattr(result, "batch_size_bytes")
-        except Exception as e:
-            # Expected without real credentials
-            assert isinstance(
-                e, (ConfigurationError, AuthenticationError, ConnectionError)
-            )
+@pytest.mark.forked
+@pytest.mark.asyncio
+async def test_async_send_batch(id_name_batch, disabled_wrapper):
+    """Test send_batch awaited from asyncio via a worker thread."""
+    result = await asyncio.to_thread(disabled_wrapper.send_batch, id_name_batch)
 
-    except Exception:
-        # Expected if wrapper creation fails
-        pass
+    assert result.success
+    assert result.attempts >= 1
+    assert result.batch_size_bytes > 0
 
 
 def test_module_imports():
@@ -405,28 +448,17 @@ def test_module_imports():
     assert hasattr(arrow_zerobus_sdk_wrapper, "TokenRefreshError")
 
 
-def test_pyarrow_compatibility():
+def test_pyarrow_compatibility(id_name_batch, id_name_schema):
     """Test PyArrow compatibility and zero-copy."""
     # Test that PyArrow RecordBatch can be used directly
-
-    # Create various PyArrow structures
-    schema = pa.schema(
-        [
-            pa.field("id", pa.int64()),
-            pa.field("name", pa.string()),
-        ]
-    )
-
-    # Test that we can create arrays and batches
-    id_array = pa.array([1, 2, 3], type=pa.int64())
-    name_array = pa.array(["Alice", "Bob", "Charlie"], type=pa.string())
-
-    batch = pa.RecordBatch.from_arrays([id_array, name_array], schema=schema)
+    batch = id_name_batch
 
     # Verify batch is valid PyArrow RecordBatch
     assert isinstance(batch, pa.RecordBatch)
     assert batch.num_rows == 3
     assert batch.num_columns == 2
+    # Built from the session schema rather than a per-test pa.schema(...)
+    assert batch.schema.equals(id_name_schema)
 
     # Test that batch can be serialized (for zero-copy transfer)
     sink = pa.BufferOutputStream()
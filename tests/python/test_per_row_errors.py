@@ -6,13 +6,21 @@ information from TransmissionResult, matching the Rust API behavior.
 
 import pytest
 
-# Skip all tests if the module is not available
-try:
-    from arrow_zerobus_sdk_wrapper import (
-        TransmissionResult,
-    )
-except ImportError:
-    pytestmark = pytest.mark.skip("arrow_zerobus_sdk_wrapper not available")
+# Skip the whole module if the bindings are not available
+arrow_zerobus_sdk_wrapper = pytest.importorskip("arrow_zerobus_sdk_wrapper")
+TransmissionResult = arrow_zerobus_sdk_wrapper.TransmissionResult
+
+# failed_rows passed to the constructor, and the same rows as the getter
+# returns them: ZerobusError.to_string() renders "ConversionError:" as
+# "Conversion error:"
+_FAILED_ROWS = [
+    (0, "ConversionError: test error"),
+    (2, "TransmissionError: network error"),
+]
+_EXPECTED_FAILED_ROWS = [
+    (0, "Conversion error: test error"),
+    (2, "Transmission error: network error"),
+]
 
 
 def test_transmission_result_new_fields_exist():
@@ -21,10 +29,7 @@ def test_transmission_result_new_fields_exist():
     result = TransmissionResult(
         success=True,
         message="Test message",
-        failed_rows=[
-            (0, "ConversionError: test error"),
-            (2, "TransmissionError: network error"),
-        ],
+        failed_rows=_FAILED_ROWS,
         successful_rows=[1, 3],
         total_rows=4,
         successful_count=2,
@@ -32,113 +37,85 @@ def test_transmission_result_new_fields_exist():
     )
 
     # Verify all new fields exist and are accessible
-    assert hasattr(result, "failed_rows")
-    assert hasattr(result, "successful_rows")
-    assert hasattr(result, "total_rows")
-    assert hasattr(result, "successful_count")
-    assert hasattr(result, "failed_count")
+    assert {
+        "failed_rows",
+        "successful_rows",
+        "total_rows",
+        "successful_count",
+        "failed_count",
+    } <= set(dir(result))
 
     # Verify field values
-    # Note: ZerobusError.to_string() produces lowercase format (e.g., "Conversion error:")
-    assert result.failed_rows == [
-        (0, "Conversion error: test error"),
-        (2, "Transmission error: network error"),
-    ]
-    assert result.successful_rows == [1, 3]
-    assert result.total_rows == 4
-    assert result.successful_count == 2
-    assert result.failed_count == 2
-
-
-def test_transmission_result_all_success():
-    """Test TransmissionResult with all rows successful."""
-    result = TransmissionResult(
-        success=True,
-        message="All rows succeeded",
-        failed_rows=None,
-        successful_rows=[0, 1, 2],
-        total_rows=3,
-        successful_count=3,
-        failed_count=0,
-    )
-
-    assert result.success is True
-    assert result.failed_rows is None or result.failed_rows == []
-    assert result.successful_rows == [0, 1, 2]
-    assert result.total_rows == 3
-    assert result.successful_count == 3
-    assert result.failed_count == 0
-
-
-def test_transmission_result_all_failed():
-    """Test TransmissionResult with all rows failed."""
-    result = TransmissionResult(
-        success=False,
-        message="All rows failed",
-        failed_rows=[
-            (0, "ConversionError: row 0 error"),
-            (1, "ConversionError: row 1 error"),
-            (2, "ConversionError: row 2 error"),
-        ],
-        successful_rows=None,
-        total_rows=3,
-        successful_count=0,
-        failed_count=3,
-    )
-
-    assert result.success is False
-    assert len(result.failed_rows) == 3
-    assert result.successful_rows is None or result.successful_rows == []
-    assert result.total_rows == 3
-    assert result.successful_count == 0
-    assert result.failed_count == 3
-
-
-def test_transmission_result_partial_success():
-    """Test TransmissionResult with partial success (some rows succeed, some fail)."""
+    assert (
+        result.failed_rows,
+        result.successful_rows,
+        result.total_rows,
+        result.successful_count,
+        result.failed_count,
+    ) == (_EXPECTED_FAILED_ROWS, [1, 3], 4, 2, 2)
+
+
+@pytest.mark.parametrize(
+    "success,failed_rows,successful_rows,total,s_count,f_count,expected_failed",
+    [
+        (True, None, [0, 1, 2], 3, 3, 0, []),
+        (
+            False,
+            [
+                (0, "ConversionError: row 0 error"),
+                (1, "ConversionError: row 1 error"),
+                (2, "ConversionError: row 2 error"),
+            ],
+            None,
+            3,
+            0,
+            3,
+            [
+                (0, "Conversion error: row 0 error"),
+                (1, "Conversion error: row 1 error"),
+                (2, "Conversion error: row 2 error"),
+            ],
+        ),
+        # Partial success is still considered success
+        (
+            True,
+            [(1, "ConversionError: row 1 failed")],
+            [0, 2],
+            3,
+            2,
+            1,
+            [(1, "Conversion error: row 1 failed")],
+        ),
+        (True, None, None, 0, 0, 0, []),
+    ],
+    ids=["all_success", "all_failed", "partial_success", "empty_batch"],
+)
+def test_transmission_result_cases(
+    success, failed_rows, successful_rows, total, s_count, f_count, expected_failed
+):
+    """Test TransmissionResult across all-success, failure and partial scenarios."""
     result = TransmissionResult(
-        success=True,  # Partial success is still considered success
-        message="Partial success",
-        failed_rows=[(1, "ConversionError: row 1 failed")],
-        successful_rows=[0, 2],
-        total_rows=3,
-        successful_count=2,
-        failed_count=1,
+        success=success,
+        failed_rows=failed_rows,
+        successful_rows=successful_rows,
+        total_rows=total,
+        successful_count=s_count,
+        failed_count=f_count,
     )
 
-    assert result.success is True
-    assert len(result.failed_rows) == 1
+    assert result.success is success
     # Note: ZerobusError.to_string() produces lowercase format
-    assert result.failed_rows[0] == (1, "Conversion error: row 1 failed")
-    assert result.successful_rows == [0, 2]
-    assert result.total_rows == 3
-    assert result.successful_count == 2
-    assert result.failed_count == 1
-
-
-def test_transmission_result_empty_batch():
-    """Test TransmissionResult with empty batch."""
-    result = TransmissionResult(
-        success=True,
-        message="Empty batch",
-        failed_rows=None,
-        successful_rows=None,
-        total_rows=0,
-        successful_count=0,
-        failed_count=0,
-    )
-
-    assert result.success is True
-    assert result.failed_rows is None or result.failed_rows == []
-    assert result.successful_rows is None or result.successful_rows == []
-    assert result.total_rows == 0
-    assert result.successful_count == 0
-    assert result.failed_count == 0
+    assert (
+        result.failed_rows,
+        result.successful_rows,
+        result.total_rows,
+        result.successful_count,
+        result.failed_count,
+    ) == (expected_failed, successful_rows or [], total, s_count, f_count)
 
 
 def test_transmission_result_consistency():
     """Test that TransmissionResult fields are consistent."""
-    # Test case 1: total_rows == successful_count + failed_count
     result1 = TransmissionResult(
         success=True,
         message="Test",
@@ -148,15 +125,15 @@ def test_transmission_result_consistency():
         successful_count=2,
         failed_count=1,
     )
-    assert result1.total_rows == result1.successful_count + result1.failed_count
+    successful_count = result1.successful_count
+    failed_count = result1.failed_count
 
-    # Test case 2: successful_rows length matches successful_count
-    if result1.successful_rows:
-        assert len(result1.successful_rows) == result1.successful_count
-
-    # Test case 3: failed_rows length matches failed_count
-    if result1.failed_rows:
-        assert len(result1.failed_rows) == result1.failed_count
+    # total_rows is the sum of the counts, and each row list matches its count
+    assert (
+        result1.total_rows,
+        len(result1.successful_rows),
+        len(result1.failed_rows),
+    ) == (successful_count + failed_count, successful_count, failed_count)
 
 
 def test_transmission_result_failed_rows_format():
@@ -174,15 +151,18 @@ def test_transmission_result_failed_rows_format():
         failed_count=2,
     )
 
-    # Verify failed_rows is a list
-    assert isinstance(result.failed_rows, list)
-
-    # Verify each element is a tuple of (int, str)
-    for failed_row in result.failed_rows:
-        assert isinstance(failed_row, tuple)
-        assert len(failed_row) == 2
-        assert isinstance(failed_row[0], int)  # Row index
-        assert isinstance(failed_row[1], str)  # Error message
+    rows = result.failed_rows
+    assert type(rows) is list
+
+    # Each element is a (row index, error message) tuple; PyO3 returns the
+    # concrete builtin types, so exact type checks are safe
+    assert all(
+        type(row) is tuple
+        and len(row) == 2
+        and type(row[0]) is int
+        and type(row[1]) is str
+        for row in rows
+    )
 
 
 def test_transmission_result_successful_rows_format():
@@ -197,11 +177,12 @@ def test_transmission_result_successful_rows_format():
         failed_count=6,
     )
 
-    # Verify successful_rows is a list
-    assert isinstance(result.successful_rows, list)
+    # Read the getter once; each access builds a new list
+    rows = result.successful_rows
+    assert isinstance(rows, list)
 
     # Verify each element is an int (row index)
-    for row_idx in result.successful_rows:
+    for row_idx in rows:
         assert isinstance(row_idx, int)
         assert row_idx >= 0
 
@@ -225,9 +206,9 @@ def test_transmission_result_backward_compatibility():
     # Note: TransmissionResult doesn't have a 'message' field
     # The 'message' parameter in constructor is ignored for backward compatibility
 
-    # New fields should have sensible defaults
-    assert result.failed_rows is None or result.failed_rows == []
-    assert result.successful_rows is None or result.successful_rows == []
+    # New fields should have sensible defaults; row lists are never None
+    assert result.failed_rows == []
+    assert result.successful_rows == []
     assert result.total_rows == 0
     assert result.successful_count == 0
     assert result.failed_count == 0
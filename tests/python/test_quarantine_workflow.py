@@ -5,49 +5,56 @@ workflow helper methods, matching the Rust API behavior.
 """
 
 import pytest
-import pyarrow as pa
 
-# Skip all tests if the module is not available
-try:
-    from arrow_zerobus_sdk_wrapper import (
-        TransmissionResult,
-    )
-except ImportError:
-    pytestmark = pytest.mark.skip("arrow_zerobus_sdk_wrapper not available")
+# Skip the whole module if the bindings are not available. Arrow imports
+# come after the gate, so a skipped module never loads pyarrow
+arrow_zerobus_sdk_wrapper = pytest.importorskip("arrow_zerobus_sdk_wrapper")
+TransmissionResult = arrow_zerobus_sdk_wrapper.TransmissionResult
 
+import numpy as np  # noqa: E402
+import pyarrow as pa  # noqa: E402
 
-def create_test_batch():
-    """Create a test RecordBatch with multiple rows."""
-    schema = pa.schema(
-        [
-            pa.field("id", pa.int64()),
-            pa.field("name", pa.string()),
-        ]
-    )
+# Row-level inputs for the ten-row batch where every row failed or succeeded
+_ALL_FAILED = tuple((i, f"Error {i}") for i in range(10))
+_ALL_SUCCESS = list(range(10))
+
+# Name column of quarantine_batch (Alice, Bob, Charlie, David, Eve, Frank,
+# Grace, Henry, Ivy, Jack) as raw Arrow string buffers: the concatenated
+# UTF-8 bytes and the int32 start offset of each value plus the end offset
+_NAME_DATA = b"AliceBobCharlieDavidEveFrankGraceHenryIvyJack"
+_NAME_OFFSETS = (0, 5, 8, 15, 20, 23, 28, 33, 38, 41, 45)
+
+
+@pytest.fixture(scope="session")
+def quarantine_batch(id_name_schema):
+    """Ten-row id/name RecordBatch, built once and only read by the tests."""
+    # The id type comes from the shared id_name_schema fixture; the name
+    # column is assembled from prebuilt buffers, skipping per-string UTF-8
+    # conversion
+    id_type = id_name_schema.field("id").type
     arrays = [
-        pa.array([1, 2, 3, 4, 5, 6, 7, 8, 9, 10], type=pa.int64()),
-        pa.array(
-            [
-                "Alice",
-                "Bob",
-                "Charlie",
-                "David",
-                "Eve",
-                "Frank",
-                "Grace",
-                "Henry",
-                "Ivy",
-                "Jack",
-            ],
-            type=pa.string(),
+        pa.array([1, 2, 3, 4, 5, 6, 7, 8, 9, 10], type=id_type),
+        pa.StringArray.from_buffers(
+            len(_NAME_OFFSETS) - 1,
+            pa.py_buffer(np.asarray(_NAME_OFFSETS, dtype=np.int32)),
+            pa.py_buffer(_NAME_DATA),
         ),
     ]
-    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+    return pa.RecordBatch.from_arrays(arrays, schema=id_name_schema)
 
 
-def test_get_failed_row_indices():
-    """Test get_failed_row_indices() method."""
-    result = TransmissionResult(
+@pytest.fixture(scope="session")
+def tiny_batch(id_name_schema):
+    """One-row id/name RecordBatch for tests that never read the rows."""
+    id_type, name_type = id_name_schema.types
+    arrays = [pa.array([1], type=id_type), pa.array(["x"], type=name_type)]
+    return pa.RecordBatch.from_arrays(arrays, schema=id_name_schema)
+
+
+@pytest.fixture(scope="module")
+def partial_result():
+    """Five-row result with rows 1 and 3 failed, shared by read-only tests."""
+    return TransmissionResult(
         success=True,
         failed_rows=[
             (1, "ConversionError: error 1"),
@@ -59,7 +66,26 @@ def test_get_failed_row_indices():
         failed_count=2,
     )
 
-    failed_indices = result.get_failed_row_indices()
+
+@pytest.fixture(scope="module")
+def quarantine_result():
+    """Result for quarantine_batch with rows 1 and 3 failed."""
+    return TransmissionResult(
+        success=True,
+        failed_rows=[
+            (1, "ConversionError: error 1"),
+            (3, "TransmissionError: error 2"),
+        ],
+        successful_rows=[0, 2, 4, 5, 6, 7, 8, 9],
+        total_rows=10,
+        successful_count=8,
+        failed_count=2,
+    )
+
+
+def test_get_failed_row_indices(partial_result):
+    """Test get_failed_row_indices() method."""
+    failed_indices = partial_result.get_failed_row_indices()
     assert failed_indices == [1, 3]
 
 
@@ -74,28 +100,38 @@ def test_get_failed_row_indices_empty():
         failed_count=0,
     )
 
-    failed_indices = result.get_failed_row_indices()
-    assert failed_indices == []
+    assert result.failed_rows == []
+    assert result.get_failed_row_indices() == []
 
 
-def test_get_successful_row_indices():
-    """Test get_successful_row_indices() method."""
-    result = TransmissionResult(
-        success=True,
-        failed_rows=[(1, "Error 1"), (3, "Error 2")],
-        successful_rows=[0, 2, 4],
-        total_rows=5,
-        successful_count=3,
-        failed_count=2,
-    )
+def test_get_failed_row_indices_array(partial_result):
+    """Test get_failed_row_indices_array() matches the list API."""
+    failed_indices = partial_result.get_failed_row_indices_array()
+    assert isinstance(failed_indices, pa.Int64Array)
+    assert failed_indices.to_pylist() == partial_result.get_failed_row_indices()
+
+    empty = TransmissionResult(success=True, total_rows=0)
+    assert len(empty.get_failed_row_indices_array()) == 0
+
 
-    successful_indices = result.get_successful_row_indices()
+def test_get_successful_row_indices(partial_result):
+    """Test get_successful_row_indices() method."""
+    successful_indices = partial_result.get_successful_row_indices()
     assert successful_indices == [0, 2, 4]
 
 
-def test_extract_failed_batch():
+def test_get_successful_row_indices_array(partial_result):
+    """Test get_successful_row_indices_array() matches the list API."""
+    successful_indices = partial_result.get_successful_row_indices_array()
+    assert isinstance(successful_indices, pa.Int64Array)
+    assert successful_indices.to_pylist() == partial_result.successful_rows
+
+    empty = TransmissionResult(success=True, total_rows=0)
+    assert len(empty.get_successful_row_indices_array()) == 0
+
+
+def test_extract_failed_batch(quarantine_batch):
     """Test extract_failed_batch() method."""
-    batch = create_test_batch()
     result = TransmissionResult(
         success=True,
         failed_rows=[(1, "Error 1"), (3, "Error 2"), (7, "Error 3")],
@@ -105,69 +141,77 @@ def test_extract_failed_batch():
         failed_count=3,
     )
 
-    failed_batch = result.extract_failed_batch(batch)
+    failed_batch = result.extract_failed_batch(quarantine_batch)
     assert failed_batch is not None
     assert failed_batch.num_rows == 3
 
     # Verify failed rows contain correct data
-    id_array = failed_batch.column("id")
-    assert id_array[0].as_py() == 2  # Row 1: Bob
-    assert id_array[1].as_py() == 4  # Row 3: David
-    assert id_array[2].as_py() == 8  # Row 7: Henry
+    # Rows 1, 3 and 7: Bob, David, Henry
+    assert failed_batch.column("id").to_pylist() == [2, 4, 8]
+    assert failed_batch.column("name").to_pylist() == ["Bob", "David", "Henry"]
+
+
+def test_extract_failed_batch_from_arrow_c_array(quarantine_batch, quarantine_result):
+    """Test batches are accepted through the Arrow PyCapsule interface."""
+
+    class CapsuleOnlyBatch:
+        """Exposes a batch only through __arrow_c_array__, like non-PyArrow producers."""
+
+        def __init__(self, batch):
+            self._batch = batch
+
+        def __arrow_c_array__(self, requested_schema=None):
+            return self._batch.__arrow_c_array__(requested_schema)
+
+    if not hasattr(quarantine_batch, "__arrow_c_array__"):
+        pytest.skip("PyArrow < 14 has no PyCapsule interface")
+
+    failed_batch = quarantine_result.extract_failed_batch(
+        CapsuleOnlyBatch(quarantine_batch)
+    )
+    assert failed_batch is not None
+    assert failed_batch.schema == quarantine_batch.schema
+    assert failed_batch.column("id").to_pylist() == [2, 4]
 
 
-def test_extract_failed_batch_empty():
+def test_extract_failed_batch_empty(tiny_batch):
     """Test extract_failed_batch() with no failed rows."""
-    batch = create_test_batch()
     result = TransmissionResult(
         success=True,
         failed_rows=None,
-        successful_rows=list(range(10)),
+        successful_rows=_ALL_SUCCESS,
         total_rows=10,
         successful_count=10,
         failed_count=0,
     )
 
-    failed_batch = result.extract_failed_batch(batch)
+    failed_batch = result.extract_failed_batch(tiny_batch)
     assert failed_batch is None
 
 
-def test_extract_successful_batch():
+def test_extract_successful_batch(quarantine_batch, quarantine_result):
     """Test extract_successful_batch() method."""
-    batch = create_test_batch()
-    result = TransmissionResult(
-        success=True,
-        failed_rows=[(1, "Error 1"), (3, "Error 2")],
-        successful_rows=[0, 2, 4, 5, 6, 7, 8, 9],
-        total_rows=10,
-        successful_count=8,
-        failed_count=2,
-    )
-
-    successful_batch = result.extract_successful_batch(batch)
+    successful_batch = quarantine_result.extract_successful_batch(quarantine_batch)
     assert successful_batch is not None
     assert successful_batch.num_rows == 8
 
     # Verify successful rows contain correct data
-    id_array = successful_batch.column("id")
-    assert id_array[0].as_py() == 1  # Row 0: Alice
-    assert id_array[1].as_py() == 3  # Row 2: Charlie
-    assert id_array[2].as_py() == 5  # Row 4: Eve
+    # Rows 0, 2 and 4-9: Alice, Charlie, Eve, Frank, Grace, Henry, Ivy, Jack
+    assert successful_batch.column("id").to_pylist() == [1, 3, 5, 6, 7, 8, 9, 10]
 
 
-def test_extract_successful_batch_empty():
+def test_extract_successful_batch_empty(tiny_batch):
     """Test extract_successful_batch() with no successful rows."""
-    batch = create_test_batch()
     result = TransmissionResult(
         success=False,
-        failed_rows=[(i, f"Error {i}") for i in range(10)],
+        failed_rows=list(_ALL_FAILED),
         successful_rows=None,
         total_rows=10,
         successful_count=0,
         failed_count=10,
     )
 
-    successful_batch = result.extract_successful_batch(batch)
+    successful_batch = result.extract_successful_batch(tiny_batch)
     assert successful_batch is None
 
 
@@ -198,78 +242,50 @@ def test_get_failed_row_indices_by_error_type():
     connection_indices = result.get_failed_row_indices_by_error_type("ConnectionError")
     assert connection_indices == [3]
 
-
-def test_is_partial_success():
-    """Test is_partial_success() method."""
-    result = TransmissionResult(
-        success=True,
-        failed_rows=[(1, "Error 1")],
-        successful_rows=[0, 2],
-        total_rows=3,
-        successful_count=2,
-        failed_count=1,
+    conversion_array = result.get_failed_row_indices_by_error_type_array(
+        "ConversionError"
     )
+    assert isinstance(conversion_array, pa.Int64Array)
+    np.testing.assert_array_equal(conversion_array.to_numpy(), np.asarray([0, 2]))
+    assert len(result.get_failed_row_indices_by_error_type_array("AuthError")) == 0
 
-    assert result.is_partial_success() is True
 
+def test_is_partial_success(partial_result):
+    """Test is_partial_success() method."""
+    assert partial_result.is_partial_success() is True
 
-def test_has_failed_rows():
-    """Test has_failed_rows() method."""
-    result = TransmissionResult(
-        success=True,
-        failed_rows=[(1, "Error 1")],
-        successful_rows=[0, 2],
-        total_rows=3,
-        successful_count=2,
-        failed_count=1,
-    )
 
-    assert result.has_failed_rows() is True
+def test_has_failed_rows(partial_result):
+    """Test has_failed_rows() method."""
+    assert partial_result.has_failed_rows() is True
 
 
-def test_has_successful_rows():
+def test_has_successful_rows(partial_result):
     """Test has_successful_rows() method."""
-    result = TransmissionResult(
-        success=True,
-        failed_rows=[(1, "Error 1")],
-        successful_rows=[0, 2],
-        total_rows=3,
-        successful_count=2,
-        failed_count=1,
-    )
-
-    assert result.has_successful_rows() is True
+    assert partial_result.has_successful_rows() is True
 
 
-def test_quarantine_workflow_complete():
+def test_quarantine_workflow_complete(quarantine_batch, quarantine_result):
     """Test complete quarantine workflow."""
-    batch = create_test_batch()
-    result = TransmissionResult(
-        success=True,
-        failed_rows=[
-            (1, "ConversionError: error 1"),
-            (3, "TransmissionError: error 2"),
-        ],
-        successful_rows=[0, 2, 4, 5, 6, 7, 8, 9],
-        total_rows=10,
-        successful_count=8,
-        failed_count=2,
-    )
-
     # Step 1: Verify partial success
-    assert result.is_partial_success()
-    assert result.has_failed_rows()
-    assert result.has_successful_rows()
+    assert quarantine_result.is_partial_success()
+    assert quarantine_result.has_failed_rows()
+    assert quarantine_result.has_successful_rows()
 
-    # Step 2: Extract failed rows for quarantine
-    failed_batch = result.extract_failed_batch(batch)
+    # Step 2: Split into failed rows for quarantine and successful rows for
+    # writing to the main table
+    failed_batch, successful_batch = quarantine_result.split_batch(quarantine_batch)
     assert failed_batch is not None
     assert failed_batch.num_rows == 2
-
-    # Step 3: Extract successful rows for writing to main table
-    successful_batch = result.extract_successful_batch(batch)
     assert successful_batch is not None
     assert successful_batch.num_rows == 8
+    assert failed_batch.equals(
+        quarantine_result.extract_failed_batch(quarantine_batch)
+    )
+    assert successful_batch.equals(
+        quarantine_result.extract_successful_batch(quarantine_batch)
+    )
 
-    # Step 4: Verify consistency
-    assert failed_batch.num_rows + successful_batch.num_rows == result.total_rows
+    # Step 3: Verify consistency
+    total_rows = failed_batch.num_rows + successful_batch.num_rows
+    assert total_rows == quarantine_result.total_rows
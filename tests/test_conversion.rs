@@ -246,6 +246,33 @@ fn test_record_batch_to_protobuf_bytes_with_nulls() {
     assert!(!bytes_list[2].is_empty());
 }
 
+#[test]
+fn test_record_batch_to_protobuf_bytes_all_null_column() {
+    let descriptor = create_test_descriptor();
+    let schema = Schema::new(vec![
+        Field::new("id", DataType::Int64, false),
+        Field::new("name", DataType::Utf8, false),
+        Field::new("score", DataType::Float64, true),
+    ]);
+    let batch = RecordBatch::try_new(
+        Arc::new(schema),
+        vec![
+            Arc::new(Int64Array::from(vec![1, 2, 3])),
+            Arc::new(StringArray::from(vec!["Alice", "Bob", "Charlie"])),
+            Arc::new(Float64Array::from(vec![None::<f64>, None, None])),
+        ],
+    )
+    .unwrap();
+    let without_score = batch.project(&[0, 1]).unwrap();
+
+    let result = conversion::record_batch_to_protobuf_bytes(&batch, &descriptor);
+    let expected = conversion::record_batch_to_protobuf_bytes(&without_score, &descriptor);
+
+    // An all-null column encodes nothing, exactly as if it were absent
+    assert_eq!(result.failed_rows.len(), 0);
+    assert_eq!(result.successful_bytes, expected.successful_bytes);
+}
+
 #[test]
 fn test_generate_descriptor_boolean() {
     let schema = Schema::new(vec![Field::new("active", DataType::Boolean, false)]);
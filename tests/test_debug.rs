@@ -0,0 +1,45 @@
+//! Tests for the debug file writer
+
+use arrow::array::Int64Array;
+use arrow::datatypes::{DataType, Field, Schema};
+use arrow::ipc::reader::StreamReader;
+use arrow::record_batch::RecordBatch;
+use arrow_zerobus_sdk_wrapper::wrapper::debug::DebugWriter;
+use std::sync::Arc;
+use std::time::Duration;
+use tempfile::TempDir;
+
+#[tokio::test]
+async fn test_debug_writer_flush_makes_arrow_stream_readable() {
+    let temp_dir = TempDir::new().unwrap();
+    let output_dir = temp_dir.path().to_path_buf();
+
+    let writer = DebugWriter::new(
+        output_dir.clone(),
+        "test_table".to_string(),
+        Duration::from_secs(5),
+        None,
+        Some(10),
+    )
+    .unwrap();
+
+    let schema = Arc::new(Schema::new(vec![Field::new("id", DataType::Int64, false)]));
+    let batch1 =
+        RecordBatch::try_new(schema.clone(), vec![Arc::new(Int64Array::from(vec![1, 2]))]).unwrap();
+    let batch2 = RecordBatch::try_new(
+        schema.clone(),
+        vec![Arc::new(Int64Array::from(vec![3, 4, 5]))],
+    )
+    .unwrap();
+
+    writer.write_arrow(&batch1).await.unwrap();
+    writer.write_arrow(&batch2).await.unwrap();
+    writer.flush().await.unwrap();
+
+    // Both batches share one stream (one schema message) and are on disk after flush
+    let file = std::fs::File::open(output_dir.join("zerobus/arrow/test_table.arrows")).unwrap();
+    let reader = StreamReader::try_new(file, None).unwrap();
+    assert_eq!(reader.schema(), schema);
+    let rows: usize = reader.map(|batch| batch.unwrap().num_rows()).sum();
+    assert_eq!(rows, 5);
+}
@@ -51,3 +51,41 @@ fn test_all_error_variants() {
     let _retry = ZerobusError::RetryExhausted("retry".to_string());
     let _token = ZerobusError::TokenRefreshError("token".to_string());
 }
+
+#[test]
+fn test_error_type_names() {
+    let cases = vec![
+        (
+            ZerobusError::ConfigurationError("c".to_string()),
+            "ConfigurationError",
+        ),
+        (
+            ZerobusError::AuthenticationError("a".to_string()),
+            "AuthenticationError",
+        ),
+        (
+            ZerobusError::ConnectionError("c".to_string()),
+            "ConnectionError",
+        ),
+        (
+            ZerobusError::ConversionError("c".to_string()),
+            "ConversionError",
+        ),
+        (
+            ZerobusError::TransmissionError("t".to_string()),
+            "TransmissionError",
+        ),
+        (
+            ZerobusError::RetryExhausted("r".to_string()),
+            "RetryExhausted",
+        ),
+        (
+            ZerobusError::TokenRefreshError("t".to_string()),
+            "TokenRefreshError",
+        ),
+    ];
+
+    for (error, expected) in cases {
+        assert_eq!(error.error_type(), expected);
+    }
+}
@@ -91,7 +91,7 @@ mod python_contract_tests {
             failed_count: 0,
         };
 
-        let py_result = PyTransmissionResult { inner: result };
+        let py_result = PyTransmissionResult::from(result);
 
         // Contract: All fields should be accessible via getters
         assert!(py_result.success());
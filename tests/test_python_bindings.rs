@@ -58,11 +58,65 @@ mod python_tests {
             failed_count: 0,
         };
 
-        let py_result = PyTransmissionResult { inner: result };
+        let py_result = PyTransmissionResult::from(result);
 
         assert!(py_result.success());
         assert_eq!(py_result.attempts(), 1);
         assert_eq!(py_result.latency_ms(), Some(100));
         assert_eq!(py_result.batch_size_bytes(), 1024);
+        // Missing row lists are exposed as empty lists, never None
+        Python::with_gil(|py| assert!(py_result.failed_rows(py).is_empty()));
+        assert!(py_result.successful_rows().is_empty());
+    }
+
+    #[test]
+    fn test_py_transmission_result_error_analysis() {
+        use arrow_zerobus_sdk_wrapper::wrapper::TransmissionResult;
+        use arrow_zerobus_sdk_wrapper::ZerobusError;
+        use pyo3::types::PyDict;
+
+        let result = TransmissionResult {
+            success: true,
+            error: None,
+            attempts: 1,
+            latency_ms: Some(10),
+            batch_size_bytes: 512,
+            failed_rows: Some(vec![
+                (1, ZerobusError::ConversionError("bad".to_string())),
+                (3, ZerobusError::TransmissionError("lost".to_string())),
+                (4, ZerobusError::ConversionError("worse".to_string())),
+            ]),
+            successful_rows: Some(vec![0, 2]),
+            total_rows: 5,
+            successful_count: 2,
+            failed_count: 3,
+        };
+
+        let py_result = PyTransmissionResult::from(result);
+
+        let grouped = py_result.group_errors_by_type();
+        assert_eq!(grouped.get("ConversionError"), Some(&vec![1, 4]));
+        assert_eq!(grouped.get("TransmissionError"), Some(&vec![3]));
+        assert_eq!(
+            py_result.get_failed_row_indices_by_error_type("ConversionError"),
+            vec![1, 4]
+        );
+        assert!(py_result
+            .get_failed_row_indices_by_error_type("ConnectionError")
+            .is_empty());
+
+        Python::with_gil(|py| {
+            let stats = py_result.get_error_statistics(py).unwrap();
+            let stats = stats.as_ref(py).downcast::<PyDict>().unwrap();
+            let counts = stats.get_item("error_type_counts").unwrap().unwrap();
+            let counts = counts.downcast::<PyDict>().unwrap();
+            let conversion: usize = counts
+                .get_item("ConversionError")
+                .unwrap()
+                .unwrap()
+                .extract()
+                .unwrap();
+            assert_eq!(conversion, 2);
+        });
     }
 }
@@ -0,0 +1,111 @@
+//! Tests for the quarantine workflow helpers on TransmissionResult
+//!
+//! Cover how failed and successful rows are taken from the original batch:
+//! contiguous index runs come back as a zero-copy slice, and indices outside
+//! the batch yield no batch at all. split_batch must agree with the two
+//! extract helpers.
+
+use arrow::array::{Int64Array, StringArray};
+use arrow::datatypes::{DataType, Field, Schema};
+use arrow::record_batch::RecordBatch;
+use arrow_zerobus_sdk_wrapper::{TransmissionResult, ZerobusError};
+use std::sync::Arc;
+
+/// Create a five-row test RecordBatch
+fn create_test_batch() -> RecordBatch {
+    let schema = Schema::new(vec![
+        Field::new("id", DataType::Int64, false),
+        Field::new("name", DataType::Utf8, false),
+    ]);
+    let id_array = Int64Array::from(vec![1, 2, 3, 4, 5]);
+    let name_array = StringArray::from(vec!["Alice", "Bob", "Charlie", "David", "Eve"]);
+    RecordBatch::try_new(
+        Arc::new(schema),
+        vec![Arc::new(id_array), Arc::new(name_array)],
+    )
+    .unwrap()
+}
+
+#[test]
+fn test_extract_successful_batch_contiguous() {
+    let batch = create_test_batch();
+    let result = TransmissionResult {
+        success: true,
+        error: None,
+        attempts: 0,
+        latency_ms: Some(100),
+        batch_size_bytes: 1024,
+        failed_rows: Some(vec![(
+            0,
+            ZerobusError::ConversionError("Row 0 error".to_string()),
+        )]),
+        successful_rows: Some(vec![3, 1, 2]),
+        total_rows: 5,
+        successful_count: 3,
+        failed_count: 1,
+    };
+
+    // Contiguous indices are returned as a slice, still in sorted order
+    let successful_batch = result.extract_successful_batch(&batch).unwrap();
+    assert_eq!(successful_batch.num_rows(), 3);
+    let id_array = successful_batch
+        .column(0)
+        .as_any()
+        .downcast_ref::<Int64Array>()
+        .unwrap();
+    assert_eq!(id_array.values().to_vec(), vec![2, 3, 4]);
+}
+
+#[test]
+fn test_extract_failed_batch_out_of_bounds() {
+    let batch = create_test_batch();
+    let result = TransmissionResult {
+        success: true,
+        error: None,
+        attempts: 0,
+        latency_ms: Some(100),
+        batch_size_bytes: 1024,
+        failed_rows: Some(vec![
+            (4, ZerobusError::ConversionError("Row 4 error".to_string())),
+            (5, ZerobusError::ConversionError("Row 5 error".to_string())),
+        ]),
+        successful_rows: Some(vec![0, 1, 2, 3]),
+        total_rows: 6,
+        successful_count: 4,
+        failed_count: 2,
+    };
+
+    // Index 5 does not exist in the 5-row batch
+    assert!(result.extract_failed_batch(&batch).is_none());
+}
+
+#[test]
+fn test_split_batch() {
+    let batch = create_test_batch();
+    let result = TransmissionResult {
+        success: true,
+        error: None,
+        attempts: 0,
+        latency_ms: Some(100),
+        batch_size_bytes: 1024,
+        failed_rows: Some(vec![
+            (1, ZerobusError::ConversionError("Row 1 error".to_string())),
+            (
+                3,
+                ZerobusError::TransmissionError("Row 3 error".to_string()),
+            ),
+        ]),
+        successful_rows: Some(vec![0, 2, 4]),
+        total_rows: 5,
+        successful_count: 3,
+        failed_count: 2,
+    };
+
+    let (failed, successful) = result.split_batch(&batch);
+    assert_eq!(failed, result.extract_failed_batch(&batch));
+    assert_eq!(successful, result.extract_successful_batch(&batch));
+    assert_eq!(
+        failed.unwrap().num_rows() + successful.unwrap().num_rows(),
+        5
+    );
+}
@@ -238,3 +238,54 @@ async fn test_user_journey_concurrent_access() {
         let _flush2 = wrapper_clone.flush().await;
     }
 }
+
+#[tokio::test]
+async fn test_wrapper_reuses_descriptor_for_known_schema() {
+    // The descriptor is generated once per schema and reused by later sends
+    use tempfile::TempDir;
+
+    let temp_dir = TempDir::new().unwrap();
+    let config = WrapperConfiguration::new(
+        "https://test.cloud.databricks.com".to_string(),
+        "test_table".to_string(),
+    )
+    .with_debug_output(temp_dir.path().to_path_buf())
+    .with_zerobus_writer_disabled(true);
+
+    let wrapper = ZerobusWrapper::new(config).await.unwrap();
+    let batch = create_test_record_batch();
+    let schema = batch.schema();
+
+    assert!(
+        wrapper.prime_schema(&schema).unwrap(),
+        "First prime should generate"
+    );
+    assert!(
+        !wrapper.prime_schema(&schema).unwrap(),
+        "Second prime should hit the cache"
+    );
+
+    // An equal schema from a different Arc hits the same entry
+    let result = wrapper
+        .send_batch(create_test_record_batch())
+        .await
+        .unwrap();
+    assert!(result.success);
+    assert!(!wrapper
+        .prime_schema(&create_test_record_batch().schema())
+        .unwrap());
+
+    // A different schema is generated on its first send
+    let other = RecordBatch::try_new(
+        Arc::new(Schema::new(vec![Field::new(
+            "value",
+            DataType::Int64,
+            false,
+        )])),
+        vec![Arc::new(Int64Array::from(vec![1, 2]))],
+    )
+    .unwrap();
+    let other_schema = other.schema();
+    wrapper.send_batch(other).await.unwrap();
+    assert!(!wrapper.prime_schema(&other_schema).unwrap());
+}